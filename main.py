@@ -33,12 +33,56 @@ VIEW_EXP_IMG_PATH = os.path.join(BASE_DIR, "images", "view_exp.png")  # Нова
 WINDOW_WIDTH = 500
 WINDOW_HEIGHT = 500
 
+# Появление окна: длительность (с) и период кадра (мс)
+_FADE_DURATION = 2.0
+_FADE_FRAME_MS = 16
+
+# Тексты информационных окон (собираются один раз при импорте)
+_ABOUT_TEXT = (
+    f"{APP_TITLE}\n{APP_VERSION}\n\n"
+    "Интерактивный био-симулятор развития клеточных культур.\n"
+    "Автор: Тынкасов Николай Павлович, 2025 год.\n\n"
+    "Программа предназначена для образовательных целей.\n\n"
+    "Функции:\n"
+    "• Создание новых экспериментов\n"
+    "• Рабочее пространство для симуляций\n"
+    "• Анализ и визуализация данных\n"
+    "• Экспорт результатов\n\n"
+    "Новые возможности:\n"
+    "✓ Рабочее пространство доступно через кнопку 'Новый эксперимент'"
+)
+
+_FEATURE_NA_TEXT = (
+    "Данная функциональность находится в стадии разработки.\n"
+    "Кнопка 'Просмотр экспериментов' временно не активна.\n\n"
+    "Вы можете использовать:\n"
+    "• Кнопку 'Новый эксперимент' для создания нового эксперимента\n"
+    "• Кнопку 'О программе' для просмотра информации\n"
+    "• Кнопку 'Выход' для закрытия приложения"
+)
+
 
 class MainMenuApp(tk.Tk):
     """
     Главное окно приложения без рамок и заголовка.
     """
 
+    # tk.Tk хранит свои атрибуты в __dict__, но для перечисленных здесь
+    # чтение/запись идёт через слоты (они часто используются в анимации).
+    __slots__ = (
+        "_logo_image",
+        "_missing_assets",
+        "_new_exp_image",
+        "_view_exp_image",
+        "_exit_icon",
+        "_about_icon",
+        "container",
+        "canvas",
+        "window_alpha",
+        "buttons_visible",
+        "button_items",
+    )
+
     def __init__(self) -> None:
         super().__init__()
 
@@ -51,9 +95,12 @@ class MainMenuApp(tk.Tk):
         # Устанавливаем атрибут прозрачности цвета для поддержки альфа-канала
         self.attributes('-transparentcolor', 'black')
         
-        # Загружаем логотип
-        self._logo_image = self._load_logo_image()
-        
+        # Логотип загружается не в __init__, а первым проходом цикла событий (см. _load_and_draw_logo)
+        self._logo_image = None
+
+        # Пути к изображениям, которых нет на диске (чтобы не обращаться к диску повторно)
+        self._missing_assets = set()
+
         # Загружаем изображения кнопок
         self._new_exp_image = None
         self._view_exp_image = None
@@ -61,12 +108,10 @@ class MainMenuApp(tk.Tk):
         self._about_icon = None
         
         # Устанавливаем фиксированный размер окна 500x500
-        self.geometry(f"{WINDOW_WIDTH}x{WINDOW_HEIGHT}")
         self.minsize(WINDOW_WIDTH, WINDOW_HEIGHT)
         self.resizable(False, False)
 
-        # Центрирование окна
-        self.update_idletasks()
+        # Центрирование окна (размер экрана доступен без прохода раскладки)
         x = (self.winfo_screenwidth() // 2) - (WINDOW_WIDTH // 2)
         y = (self.winfo_screenheight() // 2) - (WINDOW_HEIGHT // 2)
         self.geometry(f"{WINDOW_WIDTH}x{WINDOW_HEIGHT}+{x}+{y}")
@@ -98,33 +143,44 @@ class MainMenuApp(tk.Tk):
         # Начальная прозрачность окна
         self.attributes('-alpha', 0.0)
         
-        # Сначала рисуем логотип (невидимый)
-        self._draw_logo_background()
-        
+        # Сначала рисуем логотип (окно ещё прозрачно); декодирование вынесено из __init__ в первый
+        # проход цикла событий, но выполняется синхронно до первой отрисовки окна
+        self.after(0, self._load_and_draw_logo)
+
+        # Декодируем изображения кнопок, пока идёт появление окна
+        self.after_idle(self._preload_button_images)
+
         # Шаг 1: Плавное появление окна с логотипом (2 секунды)
         self._fade_in_window()
         
-        # Шаг 2: Через 2 секунды начинаем плавное появление кнопок (1 секунда)
-        self.after(2000, self._fade_in_buttons)
+        # Шаг 2: Через 2 секунды показываем кнопки
+        self.after(2000, self._reveal_buttons)
 
-    def _fade_in_window(self, step=0):
-        """Плавное появление окна за 2 секунды."""
-        if step <= 20:  # 20 шагов за 2 секунды (100ms каждый)
-            self.window_alpha = step / 20
-            
-            # Устанавливаем прозрачность окна
-            try:
-                self.attributes('-alpha', self.window_alpha)
-            except:
-                pass
-            
-            # Следующий шаг
-            if step < 20:
-                # Используем именованную функцию вместо лямбды
-                self.after(100, lambda s=step+1: self._fade_in_window(s))
-            else:
-                # Окончание анимации - окно полностью видимо
-                self.attributes('-alpha', 1.0)
+    def _fade_in_window(self, t0=None):
+        """Плавное появление окна за 2 секунды.
+
+        Прозрачность считается по прошедшему времени, поэтому при нагрузке
+        пропущенные кадры не растягивают анимацию.
+        """
+        now = time.monotonic()
+        if t0 is None:
+            t0 = now
+        self.window_alpha = min(1.0, (now - t0) / _FADE_DURATION)
+
+        # Устанавливаем прозрачность окна напрямую через Tcl (без обёртки attributes)
+        try:
+            self.tk.call('wm', 'attributes', self._w, '-alpha', self.window_alpha)
+        except:
+            pass
+
+        # Следующий кадр
+        if self.window_alpha < 1.0:
+            self.after(_FADE_FRAME_MS, self._fade_in_window, t0)
+
+    def _load_and_draw_logo(self):
+        """Загружает логотип и рисует его как фон."""
+        self._logo_image = self._load_logo_image()
+        self._draw_logo_background()
 
     def _draw_logo_background(self):
         """Отрисовывает логотип как фон."""
@@ -156,50 +212,18 @@ class MainMenuApp(tk.Tk):
                 tags="logo"
             )
 
-    def _fade_in_buttons(self, step=0):
-        """Плавное появление кнопок за 1 секунду."""
-        if step == 0:
-            # Отрисовываем кнопки (пока невидимые)
-            self._create_buttons()
-            # Скрываем все элементы кнопок
-            for item in self.button_items:
-                self.canvas.itemconfig(item, state='hidden')
-        
-        if step <= 20:  # 20 шагов за 1 секунду (50ms каждый)
-            # Показываем кнопки с текущей прозрачностью
-            if step > 0:  # На первом шаге еще скрыты
-                for item in self.button_items:
-                    self.canvas.itemconfig(item, state='normal')
-                    # Применяем эффект плавного появления через изменение прозрачности окна
-                    if step < 20:
-                        # Создаем эффект плавного появления
-                        alpha = step / 20
-                        self._apply_alpha_effect(item, alpha)
-            
-            # Следующий шаг
-            if step < 20:
-                # Используем именованную функцию вместо лямбды
-                self.after(50, lambda s=step+1: self._fade_in_buttons(s))
-            else:
-                # Кнопки полностью видны
-                self.buttons_visible = True
-                for item in self.button_items:
-                    self.canvas.itemconfig(item, state='normal')
-
-    def _apply_alpha_effect(self, item_id, alpha):
-        """Применяет эффект прозрачности к элементу canvas."""
-        item_type = self.canvas.type(item_id)
-        tags = self.canvas.gettags(item_id)
-        
-        # Пропускаем логотип
-        if "logo" in tags:
-            return
-            
-        if alpha < 1.0:
-            # Для изображений можно добавить эффект затемнения/осветления
-            if item_type == "image":
-                # Для эффекта прозрачности временно изменяем яркость
-                pass  # Tkinter не поддерживает прозрачность изображений напрямую
+    def _reveal_buttons(self):
+        """Показывает кнопки одним вызовом (Tkinter не умеет альфу для элементов canvas)."""
+        self._create_buttons()
+        self.canvas.itemconfigure("button", state='normal')
+        self.buttons_visible = True
+
+    def _preload_button_images(self):
+        """Заранее загружает изображения кнопок (результат кешируется в self._*_image/_icon)."""
+        self._get_new_exp_image()
+        self._get_view_exp_image()
+        self._get_about_icon()
+        self._get_exit_icon()
 
     # ==========================
     #   СОЗДАНИЕ КНОПОК
@@ -209,7 +233,11 @@ class MainMenuApp(tk.Tk):
         """Создает кнопки-картинки на canvas."""
         # Очищаем список элементов кнопок
         self.button_items = []
-        
+
+        # Курсор при наведении — одна привязка на общий тег всех кнопок
+        self.canvas.tag_bind("button", "<Enter>", lambda e: self.canvas.configure(cursor="hand2"))
+        self.canvas.tag_bind("button", "<Leave>", lambda e: self.canvas.configure(cursor=""))
+
         # Загружаем изображения кнопок
         new_exp_img = self._get_new_exp_image()
         view_exp_img = self._get_view_exp_image()
@@ -235,33 +263,20 @@ class MainMenuApp(tk.Tk):
                 continue
                 
             cx = start_x + idx * (button_size + spacing)
-            x0 = cx - button_size // 2
-            y0 = buttons_center_y - button_size // 2
-            x1 = cx + button_size // 2
-            y1 = buttons_center_y + button_size // 2
 
             tag = tag_name
 
-            # Изображение кнопки (без фона)
+            # Изображение кнопки (без фона) — само служит областью клика
             img_id = self.canvas.create_image(
                 cx,
                 buttons_center_y,
                 image=image,
-                tags=(tag, "button", "button_image"),
+                tags=(tag, "button", "button_image", "click_area"),
             )
             self.button_items.append(img_id)
 
-            # Невидимая область для кликов (прямоугольник по размеру изображения)
-            click_id = self.canvas.create_rectangle(
-                x0, y0, x1, y1,
-                outline="",
-                fill="",
-                tags=(tag, "button", "click_area")
-            )
-            self.button_items.append(click_id)
-
             # Обработчики событий для кнопки
-            self._bind_button_events(tag, img_id, command)
+            self._bind_hover(tag, command)
 
         # ===== НИЖНИЕ КНОПКИ (ИКОНКИ) =====
         bottom_y = WINDOW_HEIGHT - 30
@@ -277,19 +292,9 @@ class MainMenuApp(tk.Tk):
                 about_cx,
                 bottom_y,
                 image=about_icon,
-                tags=(about_tag, "button", "bottom_button"),
+                tags=(about_tag, "button", "bottom_button", "click_area"),
             )
             self.button_items.append(about_icon_id)
-            
-            # Область клика для иконки "О программе"
-            about_click_id = self.canvas.create_rectangle(
-                about_cx - btn_size // 2, bottom_y - btn_size // 2,
-                about_cx + btn_size // 2, bottom_y + btn_size // 2,
-                outline="",
-                fill="",
-                tags=(about_tag, "button", "click_area")
-            )
-            self.button_items.append(about_click_id)
         else:
             about_text_id = self.canvas.create_text(
                 about_cx,
@@ -320,19 +325,9 @@ class MainMenuApp(tk.Tk):
                 exit_cx,
                 bottom_y,
                 image=exit_icon,
-                tags=(exit_tag, "button", "bottom_button"),
+                tags=(exit_tag, "button", "bottom_button", "click_area"),
             )
             self.button_items.append(exit_icon_id)
-            
-            # Область клика для иконки "Выход"
-            exit_click_id = self.canvas.create_rectangle(
-                exit_cx - btn_size // 2, bottom_y - btn_size // 2,
-                exit_cx + btn_size // 2, bottom_y + btn_size // 2,
-                outline="",
-                fill="",
-                tags=(exit_tag, "button", "click_area")
-            )
-            self.button_items.append(exit_click_id)
         else:
             exit_text_id = self.canvas.create_text(
                 exit_cx,
@@ -354,8 +349,8 @@ class MainMenuApp(tk.Tk):
             self.button_items.append(exit_click_id)
 
         # Привязка событий к нижним кнопкам
-        self._bind_icon_button_events(about_tag, self.on_about)
-        self._bind_icon_button_events(exit_tag, self.on_exit)
+        self._bind_hover(about_tag, self.on_about)
+        self._bind_hover(exit_tag, self.on_exit)
 
     def _create_fallback_button(self, idx, start_x, center_y, size, spacing, text, command, tag_name):
         """Создает текстовую кнопку, если изображение не загрузилось."""
@@ -393,56 +388,25 @@ class MainMenuApp(tk.Tk):
         self.button_items.append(click_id)
 
         # Обработчики событий
-        self._bind_fallback_button_events(tag, text_id, command)
-
-    def _bind_button_events(self, tag, img_id, command):
-        """Привязывает события к кнопке-изображению."""
-        def on_enter(event):
-            self.canvas.configure(cursor="hand2")
-
-        def on_leave(event):
-            self.canvas.configure(cursor="")
-
-        def on_click(event):
-            command()
-
-        self.canvas.tag_bind(tag, "<Enter>", on_enter)
-        self.canvas.tag_bind(tag, "<Leave>", on_leave)
-        self.canvas.tag_bind(tag, "<Button-1>", on_click)
+        self._bind_hover(tag, command, text_id=text_id)
 
-    def _bind_fallback_button_events(self, tag, text_id, command):
-        """Привязывает события к текстовой кнопке (fallback)."""
-        def on_enter(event):
-            # Подсветка текста при наведении
-            self.canvas.itemconfig(text_id, fill="#a5f3fc")
-            self.canvas.configure(cursor="hand2")
+    def _bind_hover(self, tag, command, text_id=None):
+        """Привязывает клик к кнопке (и подсветку текста для fallback-кнопки).
 
-        def on_leave(event):
-            # Возвращаем обычный цвет
-            self.canvas.itemconfig(text_id, fill="#e5e7eb")
-            self.canvas.configure(cursor="")
-
-        def on_click(event):
-            command()
-
-        self.canvas.tag_bind(tag, "<Enter>", on_enter)
-        self.canvas.tag_bind(tag, "<Leave>", on_leave)
-        self.canvas.tag_bind(tag, "<Button-1>", on_click)
-
-    def _bind_icon_button_events(self, tag, command):
-        """Привязывает события к иконке."""
-        def on_enter(event):
-            self.canvas.configure(cursor="hand2")
-
-        def on_leave(event):
-            self.canvas.configure(cursor="")
+        Курсор при наведении обслуживается общей привязкой на тег "button".
+        """
+        self.canvas.tag_bind(tag, "<Button-1>", lambda e, c=command: c())
+        if text_id is not None:
+            self.canvas.tag_bind(tag, "<Enter>", lambda e, t=text_id: self._hover_in(t))
+            self.canvas.tag_bind(tag, "<Leave>", lambda e, t=text_id: self._hover_out(t))
 
-        def on_click(event):
-            command()
+    def _hover_in(self, text_id):
+        # Подсветка текста при наведении
+        self.canvas.itemconfig(text_id, fill="#a5f3fc")
 
-        self.canvas.tag_bind(tag, "<Enter>", on_enter)
-        self.canvas.tag_bind(tag, "<Leave>", on_leave)
-        self.canvas.tag_bind(tag, "<Button-1>", on_click)
+    def _hover_out(self, text_id):
+        # Возвращаем обычный цвет
+        self.canvas.itemconfig(text_id, fill="#e5e7eb")
 
     # ==========================
     #   ИКОНКИ И ИЗОБРАЖЕНИЯ
@@ -452,10 +416,6 @@ class MainMenuApp(tk.Tk):
         """
         Загружает логотип и масштабирует его до 500x500.
         """
-        if not os.path.exists(LOGO_IMG_PATH):
-            print(f"Логотип не найдено: {LOGO_IMG_PATH}")
-            return None
-
         try:
             from PIL import Image, ImageTk
         except ImportError:
@@ -497,9 +457,11 @@ class MainMenuApp(tk.Tk):
                 rgb_img = img.convert('RGBA')
                 new_img.paste(rgb_img, (x_offset, y_offset))
             
-            # Создаем PhotoImage
-            self._logo_photo = ImageTk.PhotoImage(new_img)
-            return self._logo_photo
+            # Создаем PhotoImage (владелец ссылки — self._logo_image)
+            return ImageTk.PhotoImage(new_img)
+        except FileNotFoundError:
+            print(f"Логотип не найдено: {LOGO_IMG_PATH}")
+            return None
         except Exception as e:
             print(f"Ошибка загрузки логотипа: {e}")
             return None
@@ -509,8 +471,7 @@ class MainMenuApp(tk.Tk):
         if self._new_exp_image is not None:
             return self._new_exp_image
             
-        if not os.path.exists(NEW_EXP_IMG_PATH):
-            print(f"Изображение кнопки не найдено: {NEW_EXP_IMG_PATH}")
+        if NEW_EXP_IMG_PATH in self._missing_assets:
             return None
             
         try:
@@ -531,6 +492,10 @@ class MainMenuApp(tk.Tk):
                 
             self._new_exp_image = ImageTk.PhotoImage(img)
             return self._new_exp_image
+        except FileNotFoundError:
+            self._missing_assets.add(NEW_EXP_IMG_PATH)
+            print(f"Изображение кнопки не найдено: {NEW_EXP_IMG_PATH}")
+            return None
         except Exception as e:
             print(f"Ошибка загрузки изображения кнопки: {e}")
             return None
@@ -540,8 +505,7 @@ class MainMenuApp(tk.Tk):
         if self._view_exp_image is not None:
             return self._view_exp_image
             
-        if not os.path.exists(VIEW_EXP_IMG_PATH):
-            print(f"Изображение кнопки не найдено: {VIEW_EXP_IMG_PATH}")
+        if VIEW_EXP_IMG_PATH in self._missing_assets:
             return None
             
         try:
@@ -562,6 +526,10 @@ class MainMenuApp(tk.Tk):
                 
             self._view_exp_image = ImageTk.PhotoImage(img)
             return self._view_exp_image
+        except FileNotFoundError:
+            self._missing_assets.add(VIEW_EXP_IMG_PATH)
+            print(f"Изображение кнопки не найдено: {VIEW_EXP_IMG_PATH}")
+            return None
         except Exception as e:
             print(f"Ошибка загрузки изображения кнопки: {e}")
             return None
@@ -571,7 +539,7 @@ class MainMenuApp(tk.Tk):
         if self._exit_icon is not None:
             return self._exit_icon
             
-        if not os.path.exists(EXIT_IMG_PATH):
+        if EXIT_IMG_PATH in self._missing_assets:
             return None
             
         try:
@@ -589,6 +557,9 @@ class MainMenuApp(tk.Tk):
                 img = img.resize((20, 20), Image.LANCZOS)
             self._exit_icon = ImageTk.PhotoImage(img)
             return self._exit_icon
+        except FileNotFoundError:
+            self._missing_assets.add(EXIT_IMG_PATH)
+            return None
         except Exception:
             return None
 
@@ -597,7 +568,7 @@ class MainMenuApp(tk.Tk):
         if self._about_icon is not None:
             return self._about_icon
             
-        if not os.path.exists(ABOUT_IMG_PATH):
+        if ABOUT_IMG_PATH in self._missing_assets:
             return None
             
         try:
@@ -615,39 +586,12 @@ class MainMenuApp(tk.Tk):
                 img = img.resize((20, 20), Image.LANCZOS)
             self._about_icon = ImageTk.PhotoImage(img)
             return self._about_icon
+        except FileNotFoundError:
+            self._missing_assets.add(ABOUT_IMG_PATH)
+            return None
         except Exception:
             return None
 
-    # ==========================
-    #   ВСПОМОГАТЕЛЬНОЕ РИСОВАНИЕ
-    # ==========================
-
-    def _create_rounded_rect(
-        self,
-        canvas: tk.Canvas,
-        x1: int,
-        y1: int,
-        x2: int,
-        radius: int = 25,
-        **kwargs,
-    ) -> int:
-        """Создаёт скруглённый прямоугольник на Canvas."""
-        points = [
-            x1 + radius, y1,
-            x2 - radius, y1,
-            x2, y1,
-            x2, y1 + radius,
-            x2, y2 - radius,
-            x2, y2,
-            x2 - radius, y2,
-            x1 + radius, y2,
-            x1, y2,
-            x1, y2 - radius,
-            x1, y1 + radius,
-            x1, y1,
-        ]
-        return canvas.create_polygon(points, smooth=True, **kwargs)
-
     # ==========================
     #   ЛОГИКА КНОПОК МЕНЮ
     # ==========================
@@ -689,15 +633,7 @@ class MainMenuApp(tk.Tk):
 
     def show_feature_not_available(self) -> None:
         """Заглушка для кнопки просмотра экспериментов."""
-        messagebox.showinfo(
-            "Функция в разработке",
-            "Данная функциональность находится в стадии разработки.\n"
-            "Кнопка 'Просмотр экспериментов' временно не активна.\n\n"
-            "Вы можете использовать:\n"
-            "• Кнопку 'Новый эксперимент' для создания нового эксперимента\n"
-            "• Кнопку 'О программе' для просмотра информации\n"
-            "• Кнопку 'Выход' для закрытия приложения",
-        )
+        messagebox.showinfo("Функция в разработке", _FEATURE_NA_TEXT)
 
     # ==========================
     #   ОБЩИЕ ДЕЙСТВИЯ
@@ -708,20 +644,7 @@ class MainMenuApp(tk.Tk):
             self.destroy()
 
     def on_about(self) -> None:
-        messagebox.showinfo(
-            "О программе",
-            f"{APP_TITLE}\n{APP_VERSION}\n\n"
-            "Интерактивный био-симулятор развития клеточных культур.\n"
-            "Автор: Тынкасов Николай Павлович, 2025 год.\n\n"
-            "Программа предназначена для образовательных целей.\n\n"
-            "Функции:\n"
-            "• Создание новых экспериментов\n"
-            "• Рабочее пространство для симуляций\n"
-            "• Анализ и визуализация данных\n"
-            "• Экспорт результатов\n\n"
-            "Новые возможности:\n"
-            "✓ Рабочее пространство доступно через кнопку 'Новый эксперимент'",
-        )
+        messagebox.showinfo("О программе", _ABOUT_TEXT)
 
 
 def main() -> None:
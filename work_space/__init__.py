@@ -11,26 +11,49 @@ __version__ = "1.0.0"
 __author__ = "Тынкасов Николай Павлович"
 __description__ = "Рабочее пространство для симуляции роста микроорганизмов"
 
-from .workspace_app import WorkspaceApp, run_workspace
-from .menu_bar import WorkspaceMenuBar, create_menu_bar
-
-# utils может отсутствовать в некоторых сборках — не валим импорт пакета
-try:
-    from .utils import DataLogger, ensure_directory, save_experiment_data, load_experiment_data
-except Exception:  # noqa: BLE001
-    DataLogger = None  # type: ignore
-    ensure_directory = None  # type: ignore
-    save_experiment_data = None  # type: ignore
-    load_experiment_data = None  # type: ignore
-
-# Опциональное окно анализа (если присутствует в проекте)
-try:
-    from .analysis_window import AnalysisWindow, run_analysis_window
-except Exception:  # noqa: BLE001
-    AnalysisWindow = None  # type: ignore
-
-    def run_analysis_window(*_args, **_kwargs):  # type: ignore
-        raise ImportError("analysis_window.py отсутствует в пакете work_space")
+import importlib
+
+# Тяжёлые UI-модули (Tkinter/PIL) подгружаются лениво при первом обращении
+# к атрибуту пакета (PEP 562), а не при `import work_space`.
+_LAZY_ATTRS = {
+    "WorkspaceApp": ".workspace_app",
+    "run_workspace": ".workspace_app",
+    "WorkspaceMenuBar": ".menu_bar",
+    "create_menu_bar": ".menu_bar",
+    "DataLogger": ".utils",
+    "ensure_directory": ".utils",
+    "save_experiment_data": ".utils",
+    "load_experiment_data": ".utils",
+    "AnalysisWindow": ".analysis_window",
+    "run_analysis_window": ".analysis_window",
+}
+
+# utils и analysis_window могут отсутствовать в некоторых сборках — не валим импорт пакета
+_OPTIONAL_MODULES = (".utils", ".analysis_window")
+
+
+def _missing_run_analysis_window(*_args, **_kwargs):  # type: ignore
+    raise ImportError("analysis_window.py отсутствует в пакете work_space")
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    try:
+        value = getattr(importlib.import_module(module_name, __name__), name)
+    except Exception:  # noqa: BLE001
+        if module_name not in _OPTIONAL_MODULES:
+            raise
+        value = _missing_run_analysis_window if name == "run_analysis_window" else None
+
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
 
 
 __all__ = [
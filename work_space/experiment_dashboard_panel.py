@@ -5,27 +5,83 @@
 from __future__ import annotations
 
 import math
+import re
 import sqlite3
 import sys
+import threading
 import time
-from dataclasses import dataclass
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import lru_cache, partial
+from itertools import islice
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
 
 import tkinter as tk
+from tkinter import font as tkfont
 from tkinter import ttk
 
 
+# Длина истории: спарклайн плитки и мини-график глюкозы/биомассы
+_TILE_HISTORY_LEN = 60
+# Короче этого спарклайн считается списковым включением: накладные расходы NumPy выше выигрыша
+_SPARK_NUMPY_MIN = 16
+_TREND_HISTORY_LEN = 100
+
+
 def _safe_float(v: Any, default: float = 0.0) -> float:
+    # быстрый путь: DoubleVar.get() и runtime_settings обычно уже отдают числа
+    if type(v) is float:
+        return v
     try:
+        # int тоже через try: слишком большое для float даёт OverflowError
         return float(v)
-    except Exception:
+    except (TypeError, ValueError, OverflowError):
         return default
 
 
 def _safe_int(v: Any, default: int = 0) -> int:
+    if type(v) is int:
+        return v
     try:
         return int(float(v))
-    except Exception:
+    except (TypeError, ValueError, OverflowError):
+        return default
+
+
+def _widen_range(lo: float, hi: float) -> Tuple[float, float]:
+    """Вырожденный диапазон (все значения равны) расширяется до 1."""
+    if hi - lo < 1e-9:
+        hi = lo + 1.0
+    return lo, hi
+
+
+def _min_max(vals: np.ndarray) -> Tuple[float, float]:
+    """Диапазон окна графика (см. _widen_range)."""
+    return _widen_range(float(vals.min()), float(vals.max()))
+
+
+# Допустимый ввод дробного числа по мере набора: "-", "1,", ".5" и т.п.
+_FLOAT_RE = re.compile(r"-?\d*[.,]?\d*")
+
+
+def _stride_window(vals: Tuple[float, ...], max_pts: int) -> Tuple[float, ...]:
+    """Прореживает ряд шагом до ~max_pts точек; последняя (самая свежая) точка сохраняется."""
+    stride = len(vals) // max(2, max_pts)
+    if stride <= 1:
+        return vals
+    return vals[(len(vals) - 1) % stride::stride]
+
+
+def _var_float(var: Optional[tk.Variable], default: Optional[float]) -> Optional[float]:
+    """Число из Tk-переменной; нет переменной или в поле недописанный ввод (TclError) — default."""
+    if var is None:
+        return default
+    try:
+        return float(var.get())
+    except (tk.TclError, TypeError, ValueError):
         return default
 
 
@@ -33,51 +89,130 @@ def _clamp(v: float, lo: float, hi: float) -> float:
     return max(lo, min(hi, v))
 
 
-def _try_import_reference_module(module_names: List[str]):
-    """Пытается импортировать модуль справочника по нескольким именам."""
-    last_err = None
-    for name in module_names:
-        try:
-            __import__(name)
-            return sys.modules[name]
-        except Exception as e:
-            last_err = e
-    return None
+def _pi_step(err: float, i: float, dt: float, kp: float, ki: float,
+             i_lo: float, i_hi: float, d_lo: float, d_hi: float) -> Tuple[float, float]:
+    """Шаг PI-регулятора: интегратор с анти-виндапом и ограниченное приращение."""
+    i = _clamp(i + err * dt, i_lo, i_hi)
+    return i, _clamp(kp * err + ki * i, d_lo, d_hi)
+
+
+# Сегментов на четверть окружности угла карточки
+_CORNER_STEPS = 4
+
 
+@lru_cache(maxsize=256)
+def _rounded_poly_points(w: int, h: int, r: int) -> Tuple[float, ...]:
+    """Точки скруглённого прямоугольника w×h от (0, 0): дуги углов посчитаны заранее,
+    полигон рисуется без smooth (Tk не разбивает сплайн при каждой отрисовке)."""
+    r = max(0, min(r, w // 2, h // 2))
+    if r == 0:
+        return (0, 0, w, 0, w, h, 0, h)
+    pts: List[float] = []
+    # углы по часовой стрелке: левый верхний, правый верхний, правый нижний, левый нижний
+    for cx, cy, a0 in ((r, r, 180), (w - r, r, 270), (w - r, h - r, 0), (r, h - r, 90)):
+        for i in range(_CORNER_STEPS + 1):
+            a = math.radians(a0 + 90 * i / _CORNER_STEPS)
+            pts.append(round(cx + r * math.cos(a), 1))
+            pts.append(round(cy + r * math.sin(a), 1))
+    return tuple(pts)
 
-def _get_microbiology_db_path(required_table: str) -> Optional[str]:
-    """Находит путь к microbiology.db через существующие справочники (get_db_path)."""
-    candidates = [
-        ["microorganisms", "database.reference_books.microorganisms"],
-        ["culture_media", "database.reference_books.culture_media"],
-        ["bioreactor_params", "database.reference_books.bioreactor_params"],
-        ["substances", "database.reference_books.substances"],
-    ]
-    for names in candidates:
-        mod = _try_import_reference_module(names)
-        if mod is None:
+
+_REFERENCE_MODULE_CANDIDATES: Tuple[Tuple[str, ...], ...] = (
+    ("microorganisms", "database.reference_books.microorganisms"),
+    ("culture_media", "database.reference_books.culture_media"),
+    ("bioreactor_params", "database.reference_books.bioreactor_params"),
+    ("substances", "database.reference_books.substances"),
+)
+
+# Кеши на процесс: модуль справочника по набору имён и путь к БД по имени таблицы
+_MOD_CACHE: Dict[Tuple[str, ...], Any] = {}
+_DB_PATH_CACHE: Dict[str, str] = {}
+
+
+def _try_import_reference_module(module_names: Tuple[str, ...]):
+    """Пытается импортировать модуль справочника по нескольким именам (результат кешируется)."""
+    key = tuple(module_names)
+    if key in _MOD_CACHE:
+        return _MOD_CACHE[key]
+    mod = None
+    for name in key:
+        try:
+            __import__(name)
+            mod = sys.modules[name]
+            break
+        except Exception:
             continue
-        fn = getattr(mod, "get_db_path", None)
-        if callable(fn):
-            try:
-                return str(fn(required_table))
-            except Exception:
+    _MOD_CACHE[key] = mod
+    return mod
+
+
+def _get_microbiology_db_path(required_tables: Any) -> Optional[str]:
+    """Находит путь к microbiology.db через существующие справочники (get_db_path).
+
+    required_tables — имя таблицы или кортеж имён (проверяются по порядку).
+    """
+    tables = (required_tables,) if isinstance(required_tables, str) else tuple(required_tables)
+    for table in tables:
+        cached = _DB_PATH_CACHE.get(table)
+        if cached:
+            return cached
+        for names in _REFERENCE_MODULE_CANDIDATES:
+            mod = _try_import_reference_module(names)
+            if mod is None:
                 continue
+            fn = getattr(mod, "get_db_path", None)
+            if callable(fn):
+                try:
+                    path = str(fn(table))
+                except Exception:
+                    continue
+                _DB_PATH_CACHE[table] = path
+                return path
     return None
 
 
 def _connect_ro(db_path: str) -> Optional[sqlite3.Connection]:
     try:
-        # uri=True позволяет file:... ?mode=ro
-        return sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+        # uri=True позволяет file:... ?mode=ro; кеш подготовленных выражений побольше
+        return sqlite3.connect(f"file:{db_path}?mode=ro", uri=True, cached_statements=256)
     except Exception:
         try:
-            return sqlite3.connect(db_path)
+            return sqlite3.connect(db_path, cached_statements=256)
         except Exception:
             return None
 
 
-@dataclass
+# Одно read-only соединение на файл БД (общее для всех панелей с этим путём) и кеш результатов
+# запросов к справочникам по (путь, sql, параметры): таблицы не меняются за время сессии.
+# Панель с другим путём получает своё соединение — чужие курсоры не закрываются.
+_SHARED_DBS: Dict[str, sqlite3.Connection] = {}
+_SHARED_DB_LOCK = threading.Lock()
+_QUERY_CACHE: Dict[Tuple[str, str, Tuple[Any, ...]], Tuple[Tuple[Any, ...], ...]] = {}
+# Подготовленные (нормализованные и сгруппированные) данные справочников по (путь, таблица)
+_REF_CACHE: Dict[Tuple[str, str], Dict[str, Any]] = {}
+# Значения штамма, которые не выводятся в подписи культуры
+_EMPTY_STRAIN = frozenset({"", "none", "null"})
+
+
+def _get_shared_db(db_path: str) -> Optional[sqlite3.Connection]:
+    """Возвращает общее RO-соединение с db_path (открывает при первом обращении)."""
+    with _SHARED_DB_LOCK:
+        db = _SHARED_DBS.get(db_path)
+        if db is not None:
+            return db
+        db = _connect_ro(db_path)
+        if db is None:
+            return None
+        try:
+            db.execute("PRAGMA query_only=1")
+            db.execute("PRAGMA cache_size=-2048")
+        except Exception:
+            pass
+        _SHARED_DBS[db_path] = db
+        return db
+
+
+@dataclass(slots=True, frozen=True)
 class TileSpec:
     key: str
     title: str
@@ -87,6 +222,251 @@ class TileSpec:
     var_name: Optional[str] = None  # имя переменной в app (tk.Variable) для уставки до запуска
     fmt: str = "{:.2f}"
     kind: str = "control"  # control | monitor | action
+    # производные поля, считаются один раз при создании спецификации
+    title_small: bool = field(init=False, repr=False, compare=False)  # длинный заголовок -> мелкий шрифт
+    fmt_fn: Callable[[float], str] = field(init=False, repr=False, compare=False)  # связанный fmt.format
+
+    def __post_init__(self):
+        object.__setattr__(self, "title_small", len(self.title) >= 14)
+        object.__setattr__(self, "fmt_fn", self.fmt.format)
+
+
+@dataclass(slots=True)
+class TileWidgets:
+    """Виджеты и палитра одной плитки (для газовых плиток spec = None)."""
+    spec: Optional[TileSpec]
+    frame: tk.Canvas
+    poly: int
+    inner: tk.Frame
+    title: Optional[tk.Label] = None
+    badge: Optional[tk.Label] = None
+    value: Optional[tk.Label] = None
+    sub: Optional[tk.Label] = None
+    spark: Optional[tk.Canvas] = None
+    graph_canvas: Optional[tk.Canvas] = None
+    fill_base: str = ""
+    border_base: str = ""
+    fill_sel: str = ""
+    border_sel: str = ""
+    auto_bg: str = ""
+    auto_sel_bg: str = ""
+    auto_br: str = ""
+    last_fill: str = ""
+    last_outline: str = ""
+    child_bgs: List[tk.Misc] = field(default_factory=list)
+    # линия спарклайна (создаётся при первой отрисовке) и данные, по которым она построена
+    spark_line: Optional[int] = None
+    spark_sig: Any = None
+    spark_size: Tuple[int, int] = (1, 1)  # размер холста спарклайна (из <Configure>)
+    hist: Optional[Deque[float]] = None  # история значений (та же deque, что в _tile_history)
+    # последний выставленный текст по имени поля-метки (value / sub)
+    last_text: Dict[str, str] = field(default_factory=dict)
+    # (факт, уставка, нижний, верхний предел), по которым в последний раз обновлялись подписи
+    last_state: Any = None
+
+
+# Единый набор спецификаций плиток (используется для отрисовки плиток в нужных местах);
+# спецификации неизменяемы и общие для всех панелей.
+_TILE_SPECS: Dict[str, TileSpec] = {
+    # Левая колонка (управление)
+    "temperature": TileSpec(
+        key="temperature",
+        title="Температура",
+        unit="°C",
+        current_key="temperature_c",
+        setpoint_key="temperature_c",
+        var_name="temperature_c_var",
+        fmt="{:.1f}",
+        kind="control",
+    ),
+    "do": TileSpec(
+        key="do",
+        title="DO",
+        unit="%",
+        current_key="do_percent",
+        setpoint_key="do_setpoint",
+        var_name="do_var",
+        fmt="{:.0f}",
+        kind="control",
+    ),
+    "aeration": TileSpec(
+        key="aeration",
+        title="Аэрация",
+        unit="L/min",
+        current_key="aeration_lpm",
+        setpoint_key="aeration_lpm",
+        var_name="aeration_lpm_var",
+        fmt="{:.1f}",
+        kind="control",
+    ),
+    "ph": TileSpec(
+        key="ph",
+        title="pH",
+        unit="",
+        current_key="ph",
+        setpoint_key="ph_setpoint",
+        var_name="ph_var",
+        fmt="{:.2f}",
+        kind="control",
+    ),
+    # Центр (управление технологией)
+    "stirring": TileSpec(
+        key="stirring",
+        title="Перемешивание",
+        unit="rpm",
+        current_key="stirring_rpm",
+        setpoint_key="stirring_rpm",
+        var_name="stirring_rpm_var",
+        fmt="{:.0f}",
+        kind="control",
+    ),
+    "media_feed": TileSpec(
+        key="media_feed",
+        title="Подача среды",
+        unit="mL/h",
+        current_key="feed_rate",
+        setpoint_key="feed_rate",
+        var_name="feed_rate_var",
+        fmt="{:.1f}",
+        kind="control",
+    ),
+    "media_level": TileSpec(
+        key="media_level",
+        title="Текущий уровень среды",
+        unit="мл",
+        current_key="volume_ml",
+        setpoint_key=None,
+        var_name=None,
+        fmt="{:.0f}",
+        kind="monitor",
+    ),
+    "media_take": TileSpec(
+        key="media_take",
+        title="Отбор среды",
+        unit="mL/h",
+        current_key="harvest_rate",
+        setpoint_key="harvest_rate",
+        var_name="harvest_rate_var",
+        fmt="{:.1f}",
+        kind="control",
+    ),
+    # Правая колонка (мониторинг)
+    "biomass": TileSpec(
+        key="biomass",
+        title="Биомасса",
+        unit="×10⁶",
+        current_key="biomass",
+        fmt="{:.2f}",
+        kind="monitor",
+    ),
+    "viability": TileSpec(
+        key="viability",
+        title="Жизнеспособность",
+        unit="%",
+        current_key="viability_percent",
+        fmt="{:.0f}",
+        kind="monitor",
+    ),
+    "doubling": TileSpec(
+        key="doubling",
+        title="Удвоение",
+        unit="ч",
+        current_key="doubling_time_h",
+        fmt="{:.1f}",
+        kind="monitor",
+    ),
+    "growth_rate": TileSpec(
+        key="growth_rate",
+        title="Скорость роста",
+        unit="/ч",
+        current_key="growth_rate",
+        fmt="{:.3f}",
+        kind="monitor",
+    ),
+    "stress": TileSpec(
+        key="stress",
+        title="Стресс",
+        unit="",
+        current_key="stress",
+        fmt="{:.2f}",
+        kind="monitor",
+    ),
+    # Нижняя панель
+    "glucose": TileSpec(
+        key="glucose",
+        title="Глюкоза",
+        unit="мг/л",
+        current_key="glucose",
+        fmt="{:.0f}",
+        kind="monitor",
+    ),
+    "biomass_add": TileSpec(
+        key="biomass_add",
+        title="Добавить биомассу",
+        unit="×10⁶",
+        current_key="biomass_added_total_mln",
+        fmt="{:.2f}",
+        kind="action",
+    ),
+    "glucose_add": TileSpec(
+        key="glucose_add",
+        title="Добавить глюкозу",
+        unit="мг",
+        current_key="glucose_added_mg_total",
+        fmt="{:.0f}",
+        kind="action",
+    ),
+}
+
+# Плитки с автоматикой: ключ плитки -> имя BooleanVar в приложении
+_AUTO_VARS: Dict[str, str] = {"ph": "ph_auto_co2_var", "do": "do_auto_aeration_var"}
+
+# Методы WorkspaceApp, которые вызывает панель (разрешаются один раз в __init__)
+_APP_FNS: Tuple[str, ...] = (
+    "start_simulation",
+    "stop_simulation",
+    "toggle_pause_simulation",
+    "apply_runtime_parameter",
+    "set_runtime_gases_config_staged",
+    "apply_runtime_gases",
+    "reset_runtime_to_applied",
+    "apply_settings",
+    "add_log_entry",
+)
+
+# Переменные app, с которыми работают регуляторы pH/DO: ключ -> имя атрибута
+_CTRL_ATTRS: Dict[str, str] = {
+    "ph_auto": "ph_auto_var",
+    "do_auto": "do_auto_var",
+    "o2": "o2_percent_var",
+    "co2": "co2_percent_var",
+    "n2": "n2_percent_var",
+    "aer": "aeration_var",
+}
+
+# Газовые плитки: (название, ключ, цвет)
+_GAS_TILES: Tuple[Tuple[str, str, str], ...] = (
+    ("O₂", "o2", "#ff6b6b"),
+    ("CO₂", "co2", "#4ecdc4"),
+    ("N₂", "n2", "#45b7d1"),
+)
+
+# Раскладка верхнего холста плиток: (строка, выравнивание группы, зазор, ((ключ, ширина), ...)).
+# Вся раскладка — один проход по таблице, без промежуточных фреймов.
+_DASH_LAYOUT: Tuple[Tuple[int, str, int, Tuple[Tuple[str, int], ...]], ...] = (
+    # row 0: [Температура] | [O2][CO2][N2] | [Биомасса][Добавить]
+    (0, "l", 0, (("temperature", 200),)),
+    (0, "c", 8, (("o2", 112), ("co2", 112), ("n2", 112))),
+    (0, "r", 10, (("biomass", 200), ("biomass_add", 200))),
+    # row 1: [DO][Аэрация] | [Перемешивание] | [Жизнеспособность][Удвоение]
+    (1, "l", 6, (("do", 155), ("aeration", 155))),
+    (1, "c", 0, (("stirring", 360),)),
+    (1, "r", 6, (("viability", 155), ("doubling", 155))),
+    # row 2: [pH] | [Подача][Уровень][Отбор] | [Рост][Стресс]
+    (2, "l", 0, (("ph", 200),)),
+    (2, "c", 6, (("media_feed", 155), ("media_level", 155), ("media_take", 155))),
+    (2, "r", 6, (("growth_rate", 155), ("stress", 155))),
+)
 
 
 class ExperimentDashboardPanel:
@@ -99,6 +479,70 @@ class ExperimentDashboardPanel:
     TILE_WIDTH = 200  # прямоугольные плитки
     TILE_HEIGHT = 180
 
+    # цвета текста плиток
+    FG_TITLE = "#223"
+    FG_MUTED = "#556"
+    FG_VALUE = "#111"
+    # акцент (выделение, линии графиков, жидкость в емкости) и корпус емкости
+    ACCENT = "#5b7cff"
+    VESSEL_OUTLINE = "#cfd6e6"
+    VESSEL_FILL = "#f7f9ff"
+
+    # период обновления панели, мс: во время эксперимента, в простое и предел при медленных тиках
+    REFRESH_MS = 500
+    REFRESH_IDLE_MS = 2000
+    REFRESH_MAX_MS = 4000
+    REFRESH_SLOW_S = 0.05  # тик дольше этого — период удваивается
+
+    # родитель ещё без размера: повтор перекладки через REPOSITION_RETRY_MS, не более REPOSITION_MAX_TRIES раз
+    # (дальше перекладку запустит приложение при изменении раскладки)
+    REPOSITION_RETRY_MS = 50
+    REPOSITION_MAX_TRIES = 40
+
+    # Переменные WorkspaceApp: (имя, класс Tk-переменной, значение по умолчанию).
+    # Создаются только отсутствующие.
+    _APP_VARS: Tuple[Tuple[str, Any, Any], ...] = (
+        # Базовые (обязательные для валидации)
+        ("vessel_id_var", tk.StringVar, ""),
+        ("vessel_type_var", tk.StringVar, ""),
+        ("vessel_name_var", tk.StringVar, "Не выбрано"),
+        ("vessel_volume_var", tk.DoubleVar, 0.0),
+        ("medium_id_var", tk.StringVar, ""),
+        ("medium_name_var", tk.StringVar, "Не выбрано"),
+        ("culture_id_var", tk.StringVar, ""),
+        ("culture_name_var", tk.StringVar, "Не выбрано"),
+        # Заселение культуры (множитель x10^6)
+        ("culture_inoculation_mln_var", tk.DoubleVar, 1.0),
+        # Внесение глюкозы (мг): ввод и накопление
+        ("glucose_add_mg_var", tk.DoubleVar, 0.0),
+        ("glucose_added_total_mg_var", tk.DoubleVar, 0.0),
+        # Добавление биомассы (×10^6): ввод и накопление
+        ("biomass_add_mln_var", tk.DoubleVar, 0.0),
+        ("biomass_added_total_mln_var", tk.DoubleVar, 0.0),
+        # Условия (нужны для apply_settings/валидации)
+        ("temperature_c_var", tk.DoubleVar, 37.0),
+        ("humidity_var", tk.IntVar, 60),
+        ("humidity_enabled_var", tk.BooleanVar, True),
+        ("ph_var", tk.DoubleVar, 7.4),
+        ("do_var", tk.DoubleVar, 100.0),
+        ("osmolality_var", tk.DoubleVar, 300.0),
+        ("glucose_var", tk.DoubleVar, 0.0),
+        ("stirring_rpm_var", tk.IntVar, 0),
+        ("aeration_lpm_var", tk.DoubleVar, 0.0),
+        ("feed_rate_var", tk.DoubleVar, 0.0),
+        ("harvest_rate_var", tk.DoubleVar, 0.0),
+        ("light_lux_var", tk.DoubleVar, 0.0),
+        ("light_cycle_var", tk.StringVar, ""),
+        # Имя и длительность, если вдруг отсутствуют
+        ("exp_name_var", tk.StringVar, ""),
+        ("duration_var", tk.IntVar, 24),
+        # Доп. свойства (не участвуют в валидации, но полезны)
+        ("operator_var", tk.StringVar, ""),
+        # Автоуправление pH по CO2 и DO по аэрации
+        ("ph_auto_co2_var", tk.BooleanVar, False),
+        ("do_auto_aeration_var", tk.BooleanVar, False),
+    )
+
     def __init__(
         self,
         parent: tk.Misc,
@@ -109,6 +553,11 @@ class ExperimentDashboardPanel:
         self.parent = parent
         self.app = app
         self.on_state_changed = on_state_changed
+        # связанные методы app (или None, если метода нет)
+        self._app_fns: Dict[str, Optional[Callable[..., Any]]] = {}
+        for name in _APP_FNS:
+            fn = getattr(app, name, None)
+            self._app_fns[name] = fn if callable(fn) else None
 
         self.state: Dict[str, Any] = dict(state or {})
         self._limits: Dict[str, Dict[str, Any]] = dict(self.state.get("limits", {}) or {})
@@ -116,26 +565,62 @@ class ExperimentDashboardPanel:
 
         self._ui_job: Optional[str] = None
         self._refresh_job: Optional[str] = None
-
-        self._tile_widgets: Dict[str, Dict[str, Any]] = {}
-        self._tile_history: Dict[str, List[float]] = {}
-        self._tile_specs_left: List[TileSpec] = []
-        self._tile_specs_right: List[TileSpec] = []
-        self._tile_specs_bottom: List[TileSpec] = []
+        self._reposition_job: Optional[str] = None
+        self._reposition_tries: int = 0
+        self._cb_fill_job: Optional[str] = None
+        # _emit_state только помечает состояние; уведомление уходит одно на пачку (after_idle)
+        self._state_dirty: bool = False
+        self._state_job: Optional[str] = None
+        # плитки, ожидающие перекраски по флажку «Авто»
+        self._style_pending: set = set()
+        # последние переданные в комбобоксы списки (по имени виджета)
+        self._cb_values: Dict[str, Tuple[str, ...]] = {}
+        # до первого показа панели списки комбобоксов только копятся здесь (по имени виджета);
+        # None — панель уже показана, списки передаются сразу
+        self._cb_deferred: Optional[Dict[str, Tuple[ttk.Combobox, Tuple[str, ...]]]] = {}
+        # последний выставленный текст обновляемых меток вне плиток (по имени виджета)
+        self._label_texts: Dict[str, str] = {}
+        # (running, paused), под которое настроены кнопки заголовка
+        self._hdr_btn_state: Optional[Tuple[bool, bool]] = None
+
+        self._tile_widgets: Dict[str, TileWidgets] = {}
+        # плитки с живыми значениями (control/monitor) в порядке создания — для _refresh_tiles
+        self._tile_list: List[TileWidgets] = []
+        self._tile_history: Dict[str, Deque[float]] = {}
+        self._tile_specs: Dict[str, TileSpec] = _TILE_SPECS
 
         self._db_path: Optional[str] = None
         self._db: Optional[sqlite3.Connection] = None
+        self._cur: Optional[sqlite3.Cursor] = None
 
         # Переменные для автоматического управления
         self._ph_auto_last_ts: float = 0.0
         self._do_auto_last_ts: float = 0.0
-        self._glucose_history: List[Tuple[float, float]] = []  # (time, concentration)
-        self._biomass_history: List[Tuple[float, float]] = []  # (time, biomass)
+        self._glucose_history: Deque[Tuple[float, float]] = deque(maxlen=_TREND_HISTORY_LEN)  # (time, concentration)
+        self._biomass_history: Deque[Tuple[float, float]] = deque(maxlen=_TREND_HISTORY_LEN)  # (time, biomass)
+        # мини-график глюкозы: (линия, подпись max, подпись min, название) и размер холста
+        self._glucose_graph_items: Optional[Tuple[int, int, int, int]] = None
+        self._glucose_graph_size: Tuple[int, int] = (1, 1)
+        # газовые плитки: (ключ gases_config, плитка, переменная уставки) — заполняются при построении
+        self._gas_refs: List[Tuple[str, TileWidgets, tk.DoubleVar]] = []
+        # ссылки регуляторов на переменные app (разрешаются при первом тике)
+        self._ctrl_refs: Optional[Dict[str, Any]] = None
+        # элементы графика панели деталей (линия, max, min) и данные последней отрисовки
+        self._det_graph_items: Optional[Tuple[int, int, int]] = None
+        self._det_graph_sig: Any = None
+        self._det_graph_size: Tuple[int, int] = (400, 110)
+        # (значения окна, размер) последней отрисовки — без изменений перерисовка пропускается
+        self._glucose_graph_sig: Optional[Tuple[Tuple[float, ...], Tuple[int, int]]] = None
+        # (размер, уровень жидкости в px, подписи) последней отрисовки реактора
+        self._reactor_key: Any = None
+        # элементы реактора (корпус, жидкость, заголовок, показания), создаются в _build_center_visual
+        self._reactor_items: Optional[Tuple[int, int, int, int]] = None
+        self._reactor_size: Tuple[int, int] = (1, 1)  # размер холста реактора (из <Configure>)
 
         self._ensure_app_vars()
         self._load_db()
         self._build_ui()
-        self.reposition()
+        self._do_reposition()
         self._start_refresh_loop()
 
     # ---------------------- lifecycle ----------------------
@@ -153,10 +638,43 @@ class ExperimentDashboardPanel:
         self._refresh_job = None
 
         try:
-            if self._db is not None:
-                self._db.close()
+            if self._reposition_job is not None:
+                self.parent.after_cancel(self._reposition_job)
+        except Exception:
+            pass
+        self._reposition_job = None
+
+        try:
+            if self._cb_fill_job is not None:
+                self.parent.after_cancel(self._cb_fill_job)
+        except Exception:
+            pass
+        self._cb_fill_job = None
+
+        try:
+            if self._state_job is not None:
+                self.parent.after_cancel(self._state_job)
+        except Exception:
+            pass
+        self._state_job = None
+        if self._state_dirty:
+            self._flush_state()
+
+        # переменная объёма живёт на app — снимаем трассировку зеркала
+        try:
+            if self._vessel_trace is not None:
+                self._var_vessel_volume.trace_remove("write", self._vessel_trace)
+        except Exception:
+            pass
+        self._vessel_trace = None
+
+        # соединение общее для всех панелей с этим путём (_SHARED_DBS) — не закрываем
+        try:
+            if self._cur is not None:
+                self._cur.close()
         except Exception:
             pass
+        self._cur = None
         self._db = None
 
         try:
@@ -179,14 +697,34 @@ class ExperimentDashboardPanel:
             pass
 
     def reposition(self):
-        """Растягивает панель на всю рабочую область, исключая нижний лог."""
-        try:
-            self.parent.update_idletasks()
-        except Exception:
-            pass
+        """Планирует перекладку панели; серия вызовов (resize) схлопывается в одну."""
+        if self._reposition_job is not None:
+            return
+        self._reposition_job = self.parent.after_idle(self._run_reposition)
 
-        w = max(200, int(getattr(self.parent, "winfo_width")()))
-        h = max(200, int(getattr(self.parent, "winfo_height")()))
+    def _run_reposition(self):
+        self._reposition_job = None
+        self._do_reposition()
+
+    def _do_reposition(self):
+        """Растягивает панель на всю рабочую область, исключая нижний лог."""
+        # Без update_idletasks: берём последний известный размер, а до отображения
+        # родителя — запрошенный; если и его нет, повторим по таймеру (не на холостом ходу:
+        # скрытый родитель иначе крутил бы перекладку на каждом проходе цикла событий).
+        parent = self.parent
+        w = int(parent.winfo_width())
+        h = int(parent.winfo_height())
+        if w <= 1 or h <= 1:
+            w = int(parent.winfo_reqwidth())
+            h = int(parent.winfo_reqheight())
+            if w <= 1 or h <= 1:
+                if self._reposition_job is None and self._reposition_tries < self.REPOSITION_MAX_TRIES:
+                    self._reposition_tries += 1
+                    self._reposition_job = parent.after(self.REPOSITION_RETRY_MS, self._run_reposition)
+                return
+        self._reposition_tries = 0
+        w = max(200, w)
+        h = max(200, h)
 
         log_h = int(getattr(self.app, "LOG_PANEL_HEIGHT", 100) or 100)
         status_h = 0
@@ -220,94 +758,87 @@ class ExperimentDashboardPanel:
 
     def _ensure_app_vars(self):
         """Гарантирует наличие переменных, на которые опирается WorkspaceApp."""
-        def ensure(name: str, var: tk.Variable):
-            if not hasattr(self.app, name) or getattr(self.app, name) is None:
-                setattr(self.app, name, var)
-
-        # Базовые (обязательные для валидации)
-        ensure("vessel_id_var", tk.StringVar(value=""))
-        ensure("vessel_type_var", tk.StringVar(value=""))
-        ensure("vessel_name_var", tk.StringVar(value="Не выбрано"))
-        ensure("vessel_volume_var", tk.DoubleVar(value=0.0))
-
-        ensure("medium_id_var", tk.StringVar(value=""))
-        ensure("medium_name_var", tk.StringVar(value="Не выбрано"))
-
-        ensure("culture_id_var", tk.StringVar(value=""))
-        ensure("culture_name_var", tk.StringVar(value="Не выбрано"))
-
-        # Заселение культуры (множитель x10^6)
-        ensure("culture_inoculation_mln_var", tk.DoubleVar(value=1.0))
-
-        # Внесение глюкозы (мг): ввод и накопление
-        ensure("glucose_add_mg_var", tk.DoubleVar(value=0.0))
-        ensure("glucose_added_total_mg_var", tk.DoubleVar(value=0.0))
-
-        # Добавление биомассы (×10^6): ввод и накопление
-        ensure("biomass_add_mln_var", tk.DoubleVar(value=0.0))
-        ensure("biomass_added_total_mln_var", tk.DoubleVar(value=0.0))
-
-        # Условия (нужны для apply_settings/валидации)
-        ensure("temperature_c_var", tk.DoubleVar(value=37.0))
-        ensure("humidity_var", tk.IntVar(value=60))
-        ensure("humidity_enabled_var", tk.BooleanVar(value=True))
-        ensure("ph_var", tk.DoubleVar(value=7.4))
-        ensure("do_var", tk.DoubleVar(value=100.0))
-        ensure("osmolality_var", tk.DoubleVar(value=300.0))
-        ensure("glucose_var", tk.DoubleVar(value=0.0))
-        ensure("stirring_rpm_var", tk.IntVar(value=0))
-        ensure("aeration_lpm_var", tk.DoubleVar(value=0.0))
-        ensure("feed_rate_var", tk.DoubleVar(value=0.0))
-        ensure("harvest_rate_var", tk.DoubleVar(value=0.0))
-        ensure("light_lux_var", tk.DoubleVar(value=0.0))
-        ensure("light_cycle_var", tk.StringVar(value=""))
-
-        # Имя и длительность, если вдруг отсутствуют
-        ensure("exp_name_var", tk.StringVar(value=""))
-        ensure("duration_var", tk.IntVar(value=24))
+        app = self.app
+        for name, var_cls, default in self._APP_VARS:
+            var = getattr(app, name, None)
+            if var is None:
+                var = var_cls(value=default)
+                setattr(app, name, var)
+            # прямая ссылка на панели: self._var_<имя без _var>
+            setattr(self, "_var_" + name[:-4], var)
+
+        # объём ёмкости меняется редко — держим зеркало на стороне Python для _draw_reactor
+        self._on_vessel_volume_write()
+        self._vessel_trace: Optional[str] = self._var_vessel_volume.trace_add("write", self._on_vessel_volume_write)
 
         # Газовая смесь (дикт на app)
-        if not hasattr(self.app, "gases_config") or not isinstance(getattr(self.app, "gases_config", None), dict):
-            self.app.gases_config = {"O2": 21.0, "CO2": 0.04, "N2": 78.96}
-
-        # Доп. свойства (не участвуют в валидации, но полезны)
-        if not hasattr(self.app, "operator_var") or getattr(self.app, "operator_var", None) is None:
-            self.app.operator_var = tk.StringVar(value="")
+        if not isinstance(getattr(app, "gases_config", None), dict):
+            app.gases_config = {"O2": 21.0, "CO2": 0.04, "N2": 78.96}
 
-        # Автоуправление pH по CO2
-        if not hasattr(self.app, 'ph_auto_co2_var') or getattr(self.app, 'ph_auto_co2_var', None) is None:
-            self.app.ph_auto_co2_var = tk.BooleanVar(value=False)
-        
-        # Автоуправление DO по аэрации
-        if not hasattr(self.app, 'do_auto_aeration_var') or getattr(self.app, 'do_auto_aeration_var', None) is None:
-            self.app.do_auto_aeration_var = tk.BooleanVar(value=False)
+    def _on_vessel_volume_write(self, *_):
+        try:
+            v = self._var_vessel_volume.get()
+        except tk.TclError:
+            v = 0.0  # в поле ввода недописанное значение
+        self._vessel_ml_cache = _safe_float(v, 0.0)
 
     # ---------------------- DB ----------------------
 
     def _load_db(self):
-        db_path = _get_microbiology_db_path("microorganisms") or _get_microbiology_db_path("culture_media") or _get_microbiology_db_path("bioreactor_params")
+        db_path = _get_microbiology_db_path(("microorganisms", "culture_media", "bioreactor_params"))
         if not db_path:
             self._db_path = None
             self._db = None
             return
         self._db_path = db_path
-        self._db = _connect_ro(db_path)
+        self._db = _get_shared_db(db_path)
+        if self._db is not None:
+            try:
+                self._cur = self._db.cursor()
+            except Exception:
+                self._cur = None
 
     def _db_query(self, sql: str, params: Tuple[Any, ...] = ()) -> List[Tuple[Any, ...]]:
-        if self._db is None:
+        if self._cur is None:
             return []
+        key = (self._db_path or "", sql, tuple(params))
+        cached = _QUERY_CACHE.get(key)
+        if cached is not None:
+            return list(cached)
         try:
-            cur = self._db.cursor()
-            cur.execute(sql, params)
-            return cur.fetchall() or []
+            with _SHARED_DB_LOCK:
+                cur = self._cur
+                cur.execute(sql, params)
+                rows = tuple(tuple(r) for r in (cur.fetchall() or []))
         except Exception:
             return []
+        _QUERY_CACHE[key] = rows
+        return list(rows)
 
     # ---------------------- UI build ----------------------
 
+    def _init_fonts(self):
+        """Общие шрифты панели: один объект Font на стиль вместо кортежа на каждый виджет."""
+        def font(size: int, weight: str = "normal") -> tkfont.Font:
+            return tkfont.Font(root=self.parent, family="Segoe UI", size=size, weight=weight)
+
+        self._F_tiny = font(7)
+        self._F_small = font(8)
+        self._F_sub = font(9)
+        self._F_text = font(10)
+        self._F_title_sm = font(10, "bold")
+        self._F_title = font(11, "bold")
+        self._F_header = font(12, "bold")
+        self._F_value = font(18, "bold")
+
     def _build_ui(self):
+        self._init_fonts()
         self._frame = tk.Frame(self.parent, bg="#f7f7f7", highlightthickness=0)
 
+        # валидаторы ввода регистрируются в Tcl один раз и разделяются всеми полями
+        self._vc_int = (self._frame.register(lambda s: s == "" or s.isdigit()), "%P")
+        self._vc_float = (self._frame.register(lambda s: s == "" or self._is_float(s)), "%P")
+
         # корневая сетка: слева свойства, справа дашборд
         self._frame.grid_columnconfigure(0, weight=0, minsize=self.LEFT_W)
         self._frame.grid_columnconfigure(1, weight=1)
@@ -318,8 +849,68 @@ class ExperimentDashboardPanel:
         self._left.grid(row=0, column=0, sticky="nsew", padx=(self.PADDING, self.PADDING//2), pady=self.PADDING)
         self._right.grid(row=0, column=1, sticky="nsew", padx=(self.PADDING//2, self.PADDING), pady=self.PADDING)
 
-        self._build_left_properties()
-        self._build_right_dashboard()
+        with self._with_frozen_layout():
+            self._build_left_properties()
+            self._build_right_dashboard()
+
+        # справочники читаются при сборке: они же выставляют app-переменные по умолчанию
+        # (ёмкость, объём, среда, культура), которые WorkspaceApp читает при старте, даже если
+        # панель ещё не показана. В комбобоксы списки уходят при первом показе панели.
+        self._populate_from_db()
+        self._frame.bind("<Map>", self._on_first_map)
+
+    def _on_first_map(self, _e=None):
+        if self._cb_deferred is None or self._cb_fill_job is not None:
+            return
+        try:
+            self._frame.unbind("<Map>")
+        except Exception:
+            pass
+        self._cb_fill_job = self.parent.after_idle(self._flush_cb_values)
+
+    def _flush_cb_values(self):
+        """Передаёт накопленные до первого показа списки в комбобоксы."""
+        self._cb_fill_job = None
+        pending, self._cb_deferred = self._cb_deferred, None
+        for cb, values in (pending or {}).values():
+            try:
+                self._set_cb_values(cb, values)
+            except Exception:
+                pass
+
+    def _populate_from_db(self):
+        """Заполняет комбобоксы справочников из БД и восстанавливает выбор из app."""
+        with self._with_frozen_layout():
+            for reload in (self._reload_bioreactor_lists, self._reload_media_lists, self._reload_culture_list):
+                try:
+                    reload()
+                except Exception:
+                    pass
+        self._emit_state()
+
+    @contextmanager
+    def _with_frozen_layout(self) -> Iterator[None]:
+        """Отключает распространение размеров колонок на время пакетной перестройки.
+
+        Геометрия пересчитывается один раз, когда propagate снова включается.
+        """
+        saved = []
+        for w in (self._left, self._right):
+            try:
+                saved.append((w, w.grid_propagate(), w.pack_propagate()))
+                w.grid_propagate(False)
+                w.pack_propagate(False)
+            except Exception:
+                pass
+        try:
+            yield
+        finally:
+            for w, grid_on, pack_on in saved:
+                try:
+                    w.grid_propagate(grid_on)
+                    w.pack_propagate(pack_on)
+                except Exception:
+                    pass
 
     def _layout_root_grid(self):
         # адаптация ширины левой панели под окно
@@ -339,17 +930,17 @@ class ExperimentDashboardPanel:
         # заголовок
         hdr = tk.Frame(self._left, bg="#f7f7f7")
         hdr.pack(fill="x")
-        tk.Label(hdr, text="Свойства эксперимента", bg="#f7f7f7", fg="#222", font=("Segoe UI", 12, "bold")).pack(anchor="w")
-        tk.Label(hdr, text="Справочники + базовые уставки (applied)", bg="#f7f7f7", fg="#555", font=("Segoe UI", 9)).pack(anchor="w", pady=(0, 8))
+        tk.Label(hdr, text="Свойства эксперимента", bg="#f7f7f7", fg="#222", font=self._F_header).pack(anchor="w")
+        tk.Label(hdr, text="Справочники + базовые уставки (applied)", bg="#f7f7f7", fg="#555", font=self._F_sub).pack(anchor="w", pady=(0, 8))
 
         card = tk.Frame(self._left, bg="#ffffff", highlightthickness=1, highlightbackground="#e3e3e3")
         card.pack(fill="both", expand=True)
         card.grid_columnconfigure(0, weight=1)
 
         # поля: название/длительность/оператор
-        self._field_entry(card, 0, "Название эксперимента", getattr(self.app, "exp_name_var"), width=30)
-        self._field_entry(card, 1, "Длительность (ч)", getattr(self.app, "duration_var"), width=10, is_int=True)
-        self._field_entry(card, 2, "Оператор", getattr(self.app, "operator_var"), width=30)
+        self._field_entry(card, 0, "Название эксперимента", self._var_exp_name, width=30)
+        self._field_entry(card, 1, "Длительность (ч)", self._var_duration, width=10, is_int=True)
+        self._field_entry(card, 2, "Оператор", self._var_operator, width=30)
 
         sep = ttk.Separator(card, orient="horizontal")
         sep.grid(row=3, column=0, sticky="ew", padx=12, pady=10)
@@ -367,22 +958,22 @@ class ExperimentDashboardPanel:
         sep2 = ttk.Separator(card, orient="horizontal")
         sep2.grid(row=16, column=0, sticky="ew", padx=12, pady=10)
 
-        tk.Label(card, text="Базовые уставки", bg="#ffffff", fg="#222", font=("Segoe UI", 10, "bold")).grid(row=17, column=0, sticky="w", padx=12, pady=(0, 6))
+        tk.Label(card, text="Базовые уставки", bg="#ffffff", fg="#222", font=self._F_title_sm).grid(row=17, column=0, sticky="w", padx=12, pady=(0, 6))
 
         grid = tk.Frame(card, bg="#ffffff")
         grid.grid(row=18, column=0, sticky="ew", padx=12)
         for c in range(2):
             grid.grid_columnconfigure(c, weight=1)
 
-        self._mini_setpoint(grid, 0, 0, "T, °C", getattr(self.app, "temperature_c_var"), width=8, is_float=True)
-        self._mini_setpoint(grid, 0, 1, "pH", getattr(self.app, "ph_var"), width=8, is_float=True)
-        self._mini_setpoint(grid, 1, 0, "DO, %", getattr(self.app, "do_var"), width=8, is_float=True)
-        self._mini_setpoint(grid, 1, 1, "RPM", getattr(self.app, "stirring_rpm_var"), width=8, is_int=True)
-        self._mini_setpoint(grid, 2, 0, "Аэрация, L/min", getattr(self.app, "aeration_lpm_var"), width=8, is_float=True)
-        self._mini_setpoint(grid, 2, 1, "Подача, mL/h", getattr(self.app, "feed_rate_var"), width=8, is_float=True)
+        self._mini_setpoint(grid, 0, 0, "T, °C", self._var_temperature_c, width=8, is_float=True)
+        self._mini_setpoint(grid, 0, 1, "pH", self._var_ph, width=8, is_float=True)
+        self._mini_setpoint(grid, 1, 0, "DO, %", self._var_do, width=8, is_float=True)
+        self._mini_setpoint(grid, 1, 1, "RPM", self._var_stirring_rpm, width=8, is_int=True)
+        self._mini_setpoint(grid, 2, 0, "Аэрация, L/min", self._var_aeration_lpm, width=8, is_float=True)
+        self._mini_setpoint(grid, 2, 1, "Подача, mL/h", self._var_feed_rate, width=8, is_float=True)
 
         # газовая смесь (applied)
-        tk.Label(card, text="Газовая смесь (applied)", bg="#ffffff", fg="#222", font=("Segoe UI", 10, "bold")).grid(row=19, column=0, sticky="w", padx=12, pady=(10, 6))
+        tk.Label(card, text="Газовая смесь (applied)", bg="#ffffff", fg="#222", font=self._F_title_sm).grid(row=19, column=0, sticky="w", padx=12, pady=(10, 6))
         gas = tk.Frame(card, bg="#ffffff")
         gas.grid(row=20, column=0, sticky="ew", padx=12)
         for c in range(3):
@@ -411,48 +1002,63 @@ class ExperimentDashboardPanel:
         f = tk.Frame(parent, bg="#ffffff")
         f.grid(row=row, column=0, sticky="ew", padx=12, pady=6)
         f.grid_columnconfigure(1, weight=1)
-        tk.Label(f, text=label, bg="#ffffff", fg="#333", font=("Segoe UI", 9)).grid(row=0, column=0, sticky="w")
+        tk.Label(f, text=label, bg="#ffffff", fg="#333", font=self._F_sub).grid(row=0, column=0, sticky="w")
         e = ttk.Entry(f, textvariable=var, width=width)
         e.grid(row=0, column=1, sticky="ew", padx=(10, 0))
         if is_int:
-            e.configure(validate="key", validatecommand=(parent.register(lambda s: s == "" or s.isdigit()), "%P"))
+            e.configure(validate="key", validatecommand=self._vc_int)
 
     def _mini_setpoint(self, parent: tk.Frame, r: int, c: int, label: str, var: tk.Variable, width: int = 7, is_float: bool = False, is_int: bool = False):
         wrap = tk.Frame(parent, bg="#ffffff")
         wrap.grid(row=r, column=c, sticky="ew", padx=4, pady=4)
-        tk.Label(wrap, text=label, bg="#ffffff", fg="#444", font=("Segoe UI", 8)).pack(anchor="w")
+        tk.Label(wrap, text=label, bg="#ffffff", fg="#444", font=self._F_small).pack(anchor="w")
         e = ttk.Entry(wrap, textvariable=var, width=width)
         e.pack(anchor="w")
         if is_int:
-            e.configure(validate="key", validatecommand=(parent.register(lambda s: s == "" or s.isdigit()), "%P"))
+            e.configure(validate="key", validatecommand=self._vc_int)
         if is_float:
-            e.configure(validate="key", validatecommand=(parent.register(lambda s: s == "" or self._is_float(s)), "%P"))
+            e.configure(validate="key", validatecommand=self._vc_float)
+
+    def _set_cb_values(self, cb: ttk.Combobox, values: Any):
+        """Передаёт список в комбобокс только если он изменился (до первого показа — откладывает)."""
+        new = tuple(values)
+        name = str(cb)
+        pending = self._cb_deferred
+        if pending is not None:
+            pending[name] = (cb, new)
+            return
+        if self._cb_values.get(name) == new:
+            return
+        cb.configure(values=new)
+        self._cb_values[name] = new
+
+    def _set_label_text(self, lbl: tk.Label, text: str):
+        """Меняет текст метки только если он изменился."""
+        name = str(lbl)
+        if self._label_texts.get(name) == text:
+            return
+        lbl.configure(text=text)
+        self._label_texts[name] = text
 
     @staticmethod
     def _is_float(s: str) -> bool:
-        try:
-            float(s.replace(",", "."))
-            return True
-        except Exception:
-            return False
+        return _FLOAT_RE.fullmatch(s) is not None
 
     # ---- select bioreactor
     def _build_bioreactor_select(self, parent: tk.Frame, row_start: int):
-        tk.Label(parent, text="Биореактор / система", bg="#ffffff", fg="#222", font=("Segoe UI", 10, "bold")).grid(row=row_start, column=0, sticky="w", padx=12, pady=(0, 6))
+        tk.Label(parent, text="Биореактор / система", bg="#ffffff", fg="#222", font=self._F_title_sm).grid(row=row_start, column=0, sticky="w", padx=12, pady=(0, 6))
 
         container = tk.Frame(parent, bg="#ffffff")
         container.grid(row=row_start + 1, column=0, sticky="ew", padx=12)
         container.grid_columnconfigure(1, weight=1)
 
-        tk.Label(container, text="Тип системы", bg="#ffffff", fg="#333", font=("Segoe UI", 9)).grid(row=0, column=0, sticky="w")
-        self._bio_type_var = tk.StringVar(value="")
-        self._bio_type_cb = ttk.Combobox(container, textvariable=self._bio_type_var, state="readonly", values=[])
+        tk.Label(container, text="Тип системы", bg="#ffffff", fg="#333", font=self._F_sub).grid(row=0, column=0, sticky="w")
+        self._bio_type_cb = ttk.Combobox(container, state="readonly", values=[])
         self._bio_type_cb.grid(row=0, column=1, sticky="ew", padx=(10, 0))
         self._bio_type_cb.bind("<<ComboboxSelected>>", lambda _e: self._on_bio_type_changed())
 
-        tk.Label(container, text="Конфигурация", bg="#ffffff", fg="#333", font=("Segoe UI", 9)).grid(row=1, column=0, sticky="w", pady=(6, 0))
-        self._bio_cfg_var = tk.StringVar(value="")
-        self._bio_cfg_cb = ttk.Combobox(container, textvariable=self._bio_cfg_var, state="readonly", values=[])
+        tk.Label(container, text="Конфигурация", bg="#ffffff", fg="#333", font=self._F_sub).grid(row=1, column=0, sticky="w", pady=(6, 0))
+        self._bio_cfg_cb = ttk.Combobox(container, state="readonly", values=[])
         self._bio_cfg_cb.grid(row=1, column=1, sticky="ew", padx=(10, 0), pady=(6, 0))
         self._bio_cfg_cb.bind("<<ComboboxSelected>>", lambda _e: self._on_bio_cfg_changed())
 
@@ -460,14 +1066,14 @@ class ExperimentDashboardPanel:
         vol_wrap = tk.Frame(parent, bg="#ffffff")
         vol_wrap.grid(row=row_start + 2, column=0, sticky="ew", padx=12, pady=(6, 0))
         vol_wrap.grid_columnconfigure(1, weight=1)
-        tk.Label(vol_wrap, text="Объём (мл/л)", bg="#ffffff", fg="#333", font=("Segoe UI", 9)).grid(row=0, column=0, sticky="w")
-        self._vessel_volume_entry = ttk.Entry(vol_wrap, textvariable=getattr(self.app, "vessel_volume_var"), width=10)
+        tk.Label(vol_wrap, text="Объём (мл/л)", bg="#ffffff", fg="#333", font=self._F_sub).grid(row=0, column=0, sticky="w")
+        self._vessel_volume_entry = ttk.Entry(vol_wrap, textvariable=self._var_vessel_volume, width=10)
         self._vessel_volume_entry.grid(row=0, column=1, sticky="w", padx=(10, 0))
 
         # заполнение из БД
         self._bio_records: List[Tuple[Any, Any, Any, Any, Any]] = []
         self._bio_by_type: Dict[str, List[Tuple[Any, Any, Any, Any, Any]]] = {}
-        self._reload_bioreactor_lists()
+        self._bio_by_key: Dict[Tuple[str, str], Tuple[Any, Any, Any, Any, Any]] = {}
 
     def _reload_bioreactor_lists(self):
         rows = self._db_query(
@@ -475,78 +1081,65 @@ class ExperimentDashboardPanel:
         )
         self._bio_records = rows
         by_type: Dict[str, List[Tuple[Any, Any, Any, Any, Any]]] = {}
+        by_key: Dict[Tuple[str, str], Tuple[Any, Any, Any, Any, Any]] = {}
         for rid, st, cfg, vol, rpm in rows:
             st_s = str(st or "").strip()
             cfg_s = str(cfg or "").strip()
-            by_type.setdefault(st_s, []).append((rid, st_s, cfg_s, vol, rpm))
+            rec = (rid, st_s, cfg_s, vol, rpm)
+            by_type.setdefault(st_s, []).append(rec)
+            by_key.setdefault((st_s, cfg_s), rec)
         self._bio_by_type = by_type
+        self._bio_by_key = by_key
         types = [t for t in by_type.keys() if t]
-        self._bio_type_cb.configure(values=types)
+        self._set_cb_values(self._bio_type_cb, types)
 
         # восстановление из app vars (если были)
-        try:
-            cur_type = str(getattr(self.app, "vessel_type_var").get() or "")
-        except Exception:
-            cur_type = ""
+        cur_type = str(self._var_vessel_type.get() or "")
         if cur_type and cur_type in types:
-            self._bio_type_var.set(cur_type)
+            self._bio_type_cb.set(cur_type)
             self._on_bio_type_changed(set_from_app=True)
         elif types:
-            self._bio_type_var.set(types[0])
+            self._bio_type_cb.set(types[0])
             self._on_bio_type_changed(set_from_app=False)
 
     def _on_bio_type_changed(self, set_from_app: bool = False):
-        st = str(self._bio_type_var.get() or "")
+        st = str(self._bio_type_cb.get() or "")
         items = self._bio_by_type.get(st, [])
         cfgs = [x[2] for x in items if x[2]]
-        self._bio_cfg_cb.configure(values=cfgs)
+        self._set_cb_values(self._bio_cfg_cb, cfgs)
         if not cfgs:
-            self._bio_cfg_var.set("")
+            self._bio_cfg_cb.set("")
             return
         # попытка восстановить из app
-        try:
-            app_name = str(getattr(self.app, "vessel_name_var").get() or "")
-        except Exception:
-            app_name = ""
+        app_name = str(self._var_vessel_name.get() or "")
         if set_from_app and app_name in cfgs:
-            self._bio_cfg_var.set(app_name)
+            self._bio_cfg_cb.set(app_name)
         else:
-            self._bio_cfg_var.set(cfgs[0])
+            self._bio_cfg_cb.set(cfgs[0])
         self._on_bio_cfg_changed()
 
     def _on_bio_cfg_changed(self):
-        st = str(self._bio_type_var.get() or "")
-        cfg = str(self._bio_cfg_var.get() or "")
-        items = self._bio_by_type.get(st, [])
-        rec = None
-        for it in items:
-            if str(it[2]) == cfg:
-                rec = it
-                break
+        st = str(self._bio_type_cb.get() or "")
+        cfg = str(self._bio_cfg_cb.get() or "")
+        rec = self._bio_by_key.get((st, cfg))
         if rec is None:
             return
         rid, st, cfg, vol, rpm = rec
 
         # app vars
-        try:
-            getattr(self.app, "vessel_id_var").set(str(rid))
-            getattr(self.app, "vessel_type_var").set(str(st))
-            getattr(self.app, "vessel_name_var").set(str(cfg))
-        except Exception:
-            pass
+        self._var_vessel_id.set(str(rid))
+        self._var_vessel_type.set(str(st))
+        self._var_vessel_name.set(str(cfg))
 
         # объем из БД (если есть)
-        try:
-            if vol is not None and str(vol) != "":
-                getattr(self.app, "vessel_volume_var").set(_safe_float(vol, 0.0))
-        except Exception:
-            pass
+        if vol is not None and str(vol) != "":
+            self._var_vessel_volume.set(_safe_float(vol, 0.0))
 
         # RPM по умолчанию (если пользователь не выставлял)
         try:
-            cur_rpm = _safe_int(getattr(self.app, "stirring_rpm_var").get(), 0)
+            cur_rpm = _safe_int(self._var_stirring_rpm.get(), 0)
             if cur_rpm <= 0 and rpm is not None:
-                getattr(self.app, "stirring_rpm_var").set(_safe_int(rpm, 0))
+                self._var_stirring_rpm.set(_safe_int(rpm, 0))
         except Exception:
             pass
 
@@ -554,101 +1147,96 @@ class ExperimentDashboardPanel:
 
     # ---- select media
     def _build_media_select(self, parent: tk.Frame, row_start: int):
-        tk.Label(parent, text="Питательная среда", bg="#ffffff", fg="#222", font=("Segoe UI", 10, "bold")).grid(row=row_start, column=0, sticky="w", padx=12, pady=(12, 6))
+        tk.Label(parent, text="Питательная среда", bg="#ffffff", fg="#222", font=self._F_title_sm).grid(row=row_start, column=0, sticky="w", padx=12, pady=(12, 6))
 
         container = tk.Frame(parent, bg="#ffffff")
         container.grid(row=row_start + 1, column=0, sticky="ew", padx=12)
         container.grid_columnconfigure(1, weight=1)
 
-        tk.Label(container, text="Тип", bg="#ffffff", fg="#333", font=("Segoe UI", 9)).grid(row=0, column=0, sticky="w")
-        self._media_type_var = tk.StringVar(value="")
-        self._media_type_cb = ttk.Combobox(container, textvariable=self._media_type_var, state="readonly", values=[])
+        tk.Label(container, text="Тип", bg="#ffffff", fg="#333", font=self._F_sub).grid(row=0, column=0, sticky="w")
+        self._media_type_cb = ttk.Combobox(container, state="readonly", values=[])
         self._media_type_cb.grid(row=0, column=1, sticky="ew", padx=(10, 0))
         self._media_type_cb.bind("<<ComboboxSelected>>", lambda _e: self._on_media_type_changed())
 
-        tk.Label(container, text="Наименование", bg="#ffffff", fg="#333", font=("Segoe UI", 9)).grid(row=1, column=0, sticky="w", pady=(6, 0))
-        self._media_name_var = tk.StringVar(value="")
-        self._media_name_cb = ttk.Combobox(container, textvariable=self._media_name_var, state="readonly", values=[])
+        tk.Label(container, text="Наименование", bg="#ffffff", fg="#333", font=self._F_sub).grid(row=1, column=0, sticky="w", pady=(6, 0))
+        self._media_name_cb = ttk.Combobox(container, state="readonly", values=[])
         self._media_name_cb.grid(row=1, column=1, sticky="ew", padx=(10, 0), pady=(6, 0))
         self._media_name_cb.bind("<<ComboboxSelected>>", lambda _e: self._on_media_name_changed())
 
         self._media_records: List[Tuple[Any, str, str]] = []
         self._media_by_type: Dict[str, List[Tuple[Any, str, str]]] = {}
-        self._reload_media_lists()
+        self._media_by_key: Dict[Tuple[str, str], Tuple[Any, str, str]] = {}
 
     def _reload_media_lists(self):
-        rows = self._db_query("SELECT id, media_type, name FROM culture_media ORDER BY media_type, name")
-        self._media_records = [(rid, str(mt or "").strip(), str(nm or "").strip()) for rid, mt, nm in rows]
-        by_type: Dict[str, List[Tuple[Any, str, str]]] = {}
-        for rid, mt, nm in self._media_records:
-            by_type.setdefault(mt, []).append((rid, mt, nm))
-        self._media_by_type = by_type
-        types = [t for t in by_type.keys() if t]
-        self._media_type_cb.configure(values=types)
+        ref_key = (self._db_path or "", "culture_media")
+        ref = _REF_CACHE.get(ref_key)
+        if ref is None:
+            rows = self._db_query("SELECT id, media_type, name FROM culture_media ORDER BY media_type, name")
+            records = [(rid, str(mt or "").strip(), str(nm or "").strip()) for rid, mt, nm in rows]
+            grouped: Dict[str, List[Tuple[Any, str, str]]] = defaultdict(list)
+            by_key: Dict[Tuple[str, str], Tuple[Any, str, str]] = {}
+            type_by_name: Dict[str, str] = {}
+            for rec in records:
+                grouped[rec[1]].append(rec)
+                by_key.setdefault((rec[1], rec[2]), rec)
+                type_by_name.setdefault(rec[2], rec[1])
+            ref = {
+                "records": records,
+                "by_type": dict(grouped),
+                "by_key": by_key,
+                "type_by_name": type_by_name,
+                "types": [t for t in grouped if t],
+            }
+            if records:
+                _REF_CACHE[ref_key] = ref
+        self._media_records = ref["records"]
+        self._media_by_type = ref["by_type"]
+        self._media_by_key = ref["by_key"]
+        types = ref["types"]
+        self._set_cb_values(self._media_type_cb, types)
 
         # восстановление
-        try:
-            cur_name = str(getattr(self.app, "medium_name_var").get() or "")
-        except Exception:
-            cur_name = ""
+        cur_name = str(self._var_medium_name.get() or "")
 
         if types:
             # найти тип по имени
-            found_type = ""
-            for mt, items in by_type.items():
-                for _, _, nm in items:
-                    if nm == cur_name:
-                        found_type = mt
-                        break
-                if found_type:
-                    break
-            self._media_type_var.set(found_type or types[0])
+            found_type = ref["type_by_name"].get(cur_name, "")
+            self._media_type_cb.set(found_type or types[0])
             self._on_media_type_changed(set_from_app=True)
 
     def _on_media_type_changed(self, set_from_app: bool = False):
-        mt = str(self._media_type_var.get() or "")
+        mt = str(self._media_type_cb.get() or "")
         items = self._media_by_type.get(mt, [])
         names = [x[2] for x in items if x[2]]
-        self._media_name_cb.configure(values=names)
+        self._set_cb_values(self._media_name_cb, names)
         if not names:
-            self._media_name_var.set("")
+            self._media_name_cb.set("")
             return
-        try:
-            cur_name = str(getattr(self.app, "medium_name_var").get() or "")
-        except Exception:
-            cur_name = ""
+        cur_name = str(self._var_medium_name.get() or "")
         if set_from_app and cur_name in names:
-            self._media_name_var.set(cur_name)
+            self._media_name_cb.set(cur_name)
         else:
-            self._media_name_var.set(names[0])
+            self._media_name_cb.set(names[0])
         self._on_media_name_changed()
 
     def _on_media_name_changed(self):
-        mt = str(self._media_type_var.get() or "")
-        nm = str(self._media_name_var.get() or "")
-        items = self._media_by_type.get(mt, [])
-        rid = ""
-        for it in items:
-            if it[2] == nm:
-                rid = str(it[0])
-                break
-        try:
-            getattr(self.app, "medium_id_var").set(rid)
-            getattr(self.app, "medium_name_var").set(nm or "Не выбрано")
-        except Exception:
-            pass
+        mt = str(self._media_type_cb.get() or "")
+        nm = str(self._media_name_cb.get() or "")
+        rec = self._media_by_key.get((mt, nm))
+        rid = str(rec[0]) if rec is not None else ""
+        self._var_medium_id.set(rid)
+        self._var_medium_name.set(nm or "Не выбрано")
         self._emit_state()
 
     # ---- select culture / microorganism
     def _build_culture_select(self, parent: tk.Frame, row_start: int):
-        tk.Label(parent, text="Изначальная культура", bg="#ffffff", fg="#222", font=("Segoe UI", 10, "bold")).grid(row=row_start, column=0, sticky="w", padx=12, pady=(12, 6))
+        tk.Label(parent, text="Изначальная культура", bg="#ffffff", fg="#222", font=self._F_title_sm).grid(row=row_start, column=0, sticky="w", padx=12, pady=(12, 6))
 
         container = tk.Frame(parent, bg="#ffffff")
         container.grid(row=row_start + 1, column=0, sticky="ew", padx=12)
         container.grid_columnconfigure(0, weight=1)
 
-        self._culture_pick_var = tk.StringVar(value="")
-        self._culture_cb = ttk.Combobox(container, textvariable=self._culture_pick_var, state="readonly", values=[])
+        self._culture_cb = ttk.Combobox(container, state="readonly", values=[])
         self._culture_cb.grid(row=0, column=0, sticky="ew")
         self._culture_cb.bind("<<ComboboxSelected>>", lambda _e: self._on_culture_changed())
 
@@ -656,75 +1244,82 @@ class ExperimentDashboardPanel:
         inoc = tk.Frame(container, bg="#ffffff")
         inoc.grid(row=1, column=0, sticky="ew", pady=(8, 0))
         inoc.grid_columnconfigure(1, weight=1)
-        tk.Label(inoc, text="Заселение культуры", bg="#ffffff", fg="#333", font=("Segoe UI", 9)).grid(row=0, column=0, sticky="w")
+        tk.Label(inoc, text="Заселение культуры", bg="#ffffff", fg="#333", font=self._F_sub).grid(row=0, column=0, sticky="w")
         mult = tk.Frame(inoc, bg="#ffffff")
         mult.grid(row=0, column=1, sticky="w", padx=(10, 0))
-        ttk.Entry(mult, textvariable=getattr(self.app, "culture_inoculation_mln_var"), width=10).grid(row=0, column=0, sticky="w")
-        tk.Label(mult, text="×10⁶", bg="#ffffff", fg="#555", font=("Segoe UI", 9)).grid(row=0, column=1, sticky="w", padx=(6, 0))
+        ttk.Entry(mult, textvariable=self._var_culture_inoculation_mln, width=10).grid(row=0, column=0, sticky="w")
+        tk.Label(mult, text="×10⁶", bg="#ffffff", fg="#555", font=self._F_sub).grid(row=0, column=1, sticky="w", padx=(6, 0))
 
         self._culture_records: List[Tuple[str, str, str, str, Optional[float], Optional[float]]] = []
         self._culture_display_to_id: Dict[str, str] = {}
         self._culture_defaults: Dict[str, Dict[str, float]] = {}
-        self._reload_culture_list()
 
     def _reload_culture_list(self):
-        rows = self._db_query(
-            "SELECT id, genus, species, strain, ph_optimum, temperature_optimum FROM microorganisms ORDER BY genus, species, strain"
-        )
-        recs = []
-        for rid, g, s, st, ph, t in rows:
-            rid_s = str(rid)
-            g_s = str(g or "").strip()
-            s_s = str(s or "").strip()
-            st_s = str(st or "").strip()
-            disp = f"{g_s} {s_s}".strip()
-            if st_s and st_s.lower() not in ("none", "null"):
-                disp = f"{disp} ({st_s})"
-            disp = disp.strip() if disp else rid_s
-            recs.append((rid_s, g_s, s_s, st_s, ph, t))
-            self._culture_display_to_id[disp] = rid_s
-            self._culture_defaults[rid_s] = {
-                "ph": _safe_float(ph, 0.0),
-                "t": _safe_float(t, 0.0),
+        ref_key = (self._db_path or "", "microorganisms")
+        ref = _REF_CACHE.get(ref_key)
+        if ref is None:
+            rows = self._db_query(
+                "SELECT id, genus, species, strain, ph_optimum, temperature_optimum FROM microorganisms ORDER BY genus, species, strain"
+            )
+            recs = []
+            display_to_id: Dict[str, str] = {}
+            defaults: Dict[str, Dict[str, float]] = {}
+            sf = _safe_float
+            for rid, g, s, st, ph, t in rows:
+                rid_s = str(rid)
+                g_s = str(g or "").strip()
+                s_s = str(s or "").strip()
+                st_s = str(st or "").strip()
+                base = " ".join(p for p in (g_s, s_s) if p)
+                if st_s.lower() not in _EMPTY_STRAIN:
+                    disp = f"{base} ({st_s})" if base else f"({st_s})"
+                else:
+                    disp = base or rid_s
+                recs.append((rid_s, g_s, s_s, st_s, ph, t))
+                display_to_id[disp] = rid_s
+                defaults[rid_s] = {
+                    "ph": sf(ph, 0.0),
+                    "t": sf(t, 0.0),
+                }
+            ref = {
+                "records": recs,
+                "display_to_id": display_to_id,
+                "defaults": defaults,
+                "displays": list(display_to_id.keys()),
             }
-        self._culture_records = recs
+            if recs:
+                _REF_CACHE[ref_key] = ref
+        self._culture_records = ref["records"]
+        self._culture_display_to_id = ref["display_to_id"]
+        self._culture_defaults = ref["defaults"]
 
-        displays = list(self._culture_display_to_id.keys())
-        self._culture_cb.configure(values=displays)
+        displays = ref["displays"]
+        self._set_cb_values(self._culture_cb, displays)
 
         # восстановление
-        try:
-            cur_name = str(getattr(self.app, "culture_name_var").get() or "")
-        except Exception:
-            cur_name = ""
+        cur_name = str(self._var_culture_name.get() or "")
         if cur_name in displays:
-            self._culture_pick_var.set(cur_name)
+            self._culture_cb.set(cur_name)
             self._on_culture_changed(set_from_app=True)
         elif displays:
-            self._culture_pick_var.set(displays[0])
+            self._culture_cb.set(displays[0])
             self._on_culture_changed(set_from_app=False)
 
     def _on_culture_changed(self, set_from_app: bool = False):
-        disp = str(self._culture_pick_var.get() or "")
+        disp = str(self._culture_cb.get() or "")
         rid = self._culture_display_to_id.get(disp, "")
-        try:
-            getattr(self.app, "culture_id_var").set(rid)
-            getattr(self.app, "culture_name_var").set(disp or "Не выбрано")
-        except Exception:
-            pass
+        self._var_culture_id.set(rid)
+        self._var_culture_name.set(disp or "Не выбрано")
 
         # автоподстановка T/pH, если заполнено в справочнике и пользователь не менял явно
         if rid:
             d = self._culture_defaults.get(rid, {})
             ph = _safe_float(d.get("ph", 0.0), 0.0)
             tc = _safe_float(d.get("t", 0.0), 0.0)
-            try:
-                if ph > 0:
-                    getattr(self.app, "ph_var").set(ph)
-                if tc > -50:
-                    getattr(self.app, "temperature_c_var").set(tc)
-            except Exception:
-                pass
+            if ph > 0:
+                self._var_ph.set(ph)
+            if tc > -50:
+                self._var_temperature_c.set(tc)
 
         self._emit_state()
 
@@ -751,8 +1346,8 @@ class ExperimentDashboardPanel:
         self._hdr.grid_columnconfigure(1, weight=0)
 
         tk.Label(self._hdr, text="Мониторинг и управление", bg="#ffffff", fg="#222",
-                 font=("Segoe UI", 12, "bold")).grid(row=0, column=0, sticky="w", padx=12, pady=(8, 0))
-        self._hdr_status = tk.Label(self._hdr, text="—", bg="#ffffff", fg="#666", font=("Segoe UI", 9))
+                 font=self._F_header).grid(row=0, column=0, sticky="w", padx=12, pady=(8, 0))
+        self._hdr_status = tk.Label(self._hdr, text="—", bg="#ffffff", fg="#666", font=self._F_sub)
         self._hdr_status.grid(row=1, column=0, sticky="w", padx=12, pady=(0, 8))
 
         btnbar = tk.Frame(self._hdr, bg="#ffffff")
@@ -773,338 +1368,152 @@ class ExperimentDashboardPanel:
         self._mid.grid_columnconfigure(1, weight=2, uniform="dashcol")
         self._mid.grid_columnconfigure(2, weight=1, uniform="dashcol")
 
-        # строки: 3 строки плиток + емкость + нижняя панель
+        # строки: холст плиток + емкость + разделитель + нижний холст
         self._mid.grid_rowconfigure(0, weight=0)
-        self._mid.grid_rowconfigure(1, weight=0)
-        self._mid.grid_rowconfigure(2, weight=0)
-        self._mid.grid_rowconfigure(3, weight=1)
-        self._mid.grid_rowconfigure(4, weight=0)
+        self._mid.grid_rowconfigure(1, weight=1)
 
         self._build_tiles_specs()
 
-        # ---- row 0: [Температура] | [O2][CO2][N2] | [Биомасса][Добавить]...[заглушки]
-        r0_l = tk.Frame(self._mid, bg="#ffffff")
-        r0_c = tk.Frame(self._mid, bg="#ffffff")
-        r0_r = tk.Frame(self._mid, bg="#ffffff")
-        r0_l.grid(row=0, column=0, sticky="nw", padx=(0, 8), pady=(0, 8))
-        r0_c.grid(row=0, column=1, sticky="n", pady=(0, 8))
-        r0_r.grid(row=0, column=2, sticky="ne", padx=(8, 0), pady=(0, 8))
-
-        self._create_tile(r0_l, self._tile_specs["temperature"], width=200, height=180).grid(row=0, column=0, sticky="n")
-
-        self._build_gas_tiles(r0_c)
-
-        # правая верхняя строка: биомасса + добавить + заглушки
-        top_actions = tk.Frame(r0_r, bg=self._tiles_bg)
-        top_actions.pack(anchor="ne")
-
-        # Биомасса + добавление биомассы (добавляет к текущей)
-        self._create_tile(top_actions, self._tile_specs["biomass"]).grid(row=0, column=0, sticky="n", padx=(0, 10))
-        self._create_tile(top_actions, self._tile_specs["biomass_add"]).grid(row=0, column=1, sticky="n")
-
-
-
-        # ---- row 1: [DO][Аэрация] | [Перемешивание] | [Жизнеспособность][Удвоение]
-        r1_l = tk.Frame(self._mid, bg="#ffffff")
-        r1_c = tk.Frame(self._mid, bg="#ffffff")
-        r1_r = tk.Frame(self._mid, bg="#ffffff")
-        r1_l.grid(row=1, column=0, sticky="nw", padx=(0, 8), pady=(0, 8))
-        r1_c.grid(row=1, column=1, sticky="n", pady=(0, 8))
-        r1_r.grid(row=1, column=2, sticky="ne", padx=(8, 0), pady=(0, 8))
-
-        # DO + Аэрация рядом
-        pair_left = tk.Frame(r1_l, bg="#ffffff")
-        pair_left.grid(row=0, column=0, sticky="n")
-        pair_left.grid_columnconfigure(0, weight=1)
-        pair_left.grid_columnconfigure(1, weight=1)
-        self._create_tile(pair_left, self._tile_specs["do"], width=155, height=180).grid(row=0, column=0, padx=(0, 6), sticky="n")
-        self._create_tile(pair_left, self._tile_specs["aeration"], width=155, height=180).grid(row=0, column=1, sticky="n")
-
-        self._create_tile(r1_c, self._tile_specs["stirring"], width=360, height=180).grid(row=0, column=0, sticky="n")
-
-        pair_right = tk.Frame(r1_r, bg="#ffffff")
-        pair_right.grid(row=0, column=0, sticky="n")
-        pair_right.grid_columnconfigure(0, weight=1)
-        pair_right.grid_columnconfigure(1, weight=1)
-        self._create_tile(pair_right, self._tile_specs["viability"], width=155, height=180).grid(row=0, column=0, padx=(0, 6), sticky="n")
-        self._create_tile(pair_right, self._tile_specs["doubling"], width=155, height=180).grid(row=0, column=1, sticky="n")
-
-        # ---- row 2: [pH] | [Подача][Уровень][Отбор] | [Рост][Стресс]
-        r2_l = tk.Frame(self._mid, bg="#ffffff")
-        r2_c = tk.Frame(self._mid, bg="#ffffff")
-        r2_r = tk.Frame(self._mid, bg="#ffffff")
-        r2_l.grid(row=2, column=0, sticky="nw", padx=(0, 8), pady=(0, 8))
-        r2_c.grid(row=2, column=1, sticky="n", pady=(0, 8))
-        r2_r.grid(row=2, column=2, sticky="ne", padx=(8, 0), pady=(0, 8))
-
-        self._create_tile(r2_l, self._tile_specs["ph"], width=200, height=180).grid(row=0, column=0, sticky="n")
-
-        trio = tk.Frame(r2_c, bg="#ffffff")
-        trio.grid(row=0, column=0, sticky="n")
-        for c in range(3):
-            trio.grid_columnconfigure(c, weight=1)
-        self._create_tile(trio, self._tile_specs["media_feed"], width=155, height=180).grid(row=0, column=0, padx=(0, 6), sticky="n")
-        self._create_tile(trio, self._tile_specs["media_level"], width=155, height=180).grid(row=0, column=1, padx=(0, 6), sticky="n")
-        self._create_tile(trio, self._tile_specs["media_take"], width=155, height=180).grid(row=0, column=2, sticky="n")
-
-        pair2 = tk.Frame(r2_r, bg="#ffffff")
-        pair2.grid(row=0, column=0, sticky="n")
-        pair2.grid_columnconfigure(0, weight=1)
-        pair2.grid_columnconfigure(1, weight=1)
-        self._create_tile(pair2, self._tile_specs["growth_rate"], width=155, height=180).grid(row=0, column=0, padx=(0, 6), sticky="n")
-        self._create_tile(pair2, self._tile_specs["stress"], width=155, height=180).grid(row=0, column=1, sticky="n")
-
-        # ---- row 3: визуализация емкости 300x300 (по центру)
-        vis = tk.Frame(self._mid, bg="#ffffff")
-        vis.grid(row=3, column=0, columnspan=3, sticky="nsew", pady=(0, 8))
-        self._build_center_visual(vis)
-
-        # ---- row 4: нижняя панель глюкозы
-        bottom = tk.Frame(self._mid, bg="#ffffff")
-        bottom.grid(row=4, column=0, columnspan=3, sticky="ew")
-
-        sep = ttk.Separator(bottom, orient="horizontal")
-        sep.pack(fill="x", pady=(0, 8))
-
-        b_row = tk.Frame(bottom, bg="#ffffff")
-        b_row.pack(anchor="w")
-
-        self._create_tile(b_row, self._tile_specs["glucose"], width=200, height=180).grid(row=0, column=0, padx=(0, 8), sticky="w")
-        self._create_tile(b_row, self._tile_specs["glucose_add"], width=320, height=180).grid(row=0, column=1, sticky="w")
+        # ---- три строки плиток: все карточки — элементы одного холста.
+        # Группа плиток строки прижата влево / по центру / вправо; при изменении
+        # ширины холста группы сдвигаются целиком (_on_dash_configure).
+        row_h = self.TILE_HEIGHT + 8
+        self._dash_groups: List[List[Any]] = []  # [тег, выравнивание, ширина группы, текущий x]
+        self._dash_w = 1235
+        self._dash_canvas = tk.Canvas(self._mid, width=self._dash_w, height=3 * row_h - 8,
+                                      bg="#ffffff", highlightthickness=0)
+        self._dash_canvas.grid(row=0, column=0, columnspan=3, sticky="ew", pady=(0, 8))
+        self._dash_canvas.bind("<Configure>", self._on_dash_configure)
+        c = self._dash_canvas
+
+        gas_by_key = {k: (n, col) for n, k, col in _GAS_TILES}
+        for row, align, gap, items in _DASH_LAYOUT:
+            tag, y, xs = self._dash_group(row, align, tuple(w for _k, w in items), gap)
+            for x, (key, w) in zip(xs, items):
+                gas = gas_by_key.get(key)
+                if gas is not None:
+                    self._create_gas_tile(c, gas[0], key, gas[1], x, y, width=w, height=112, tags=tag)
+                else:
+                    self._create_tile(c, self._tile_specs[key], x, y, w, self.TILE_HEIGHT, tag)
+
+        # ---- визуализация емкости 300x300 (по центру строки, прямо в _mid)
+        self._build_center_visual(self._mid)
+        # спецификации подписей емкости (None — плитки нет)
+        tiles = self._tile_widgets
+        self._temp_spec = tiles["temperature"].spec if "temperature" in tiles else None
+        self._ph_spec = tiles["ph"].spec if "ph" in tiles else None
+        self._do_spec = tiles["do"].spec if "do" in tiles else None
+
+        # ---- нижняя панель глюкозы (свой холст на обе карточки)
+        ttk.Separator(self._mid, orient="horizontal").grid(row=2, column=0, columnspan=3, sticky="ew", pady=(0, 8))
+
+        self._dash_bottom = tk.Canvas(self._mid, width=528, height=180, bg="#ffffff", highlightthickness=0)
+        self._dash_bottom.grid(row=3, column=0, columnspan=3, sticky="w")
+
+        self._create_tile(self._dash_bottom, self._tile_specs["glucose"], 0, 0, 200, 180)
+        self._create_tile(self._dash_bottom, self._tile_specs["glucose_add"], 208, 0, 320, 180)
 
         # ---------------- details ----------------
         self._details = tk.Frame(card, bg="#f9f9f9", highlightthickness=1, highlightbackground="#e3e3e3")
         self._details.grid(row=2, column=0, sticky="nsew", padx=12, pady=(0, 12))
         self._details.grid_columnconfigure(0, weight=1)
-        self._build_details_panel()
+        # содержимое панели деталей строится при первом выборе плитки
+        # (или сразу, если выбор восстановлен из состояния)
+        self._details_built = False
+        if self._selected_tile_key:
+            self._ensure_details_panel()
 
     def _build_tiles_specs(self):
-        # Единый набор спецификаций (используется для отрисовки плиток в нужных местах)
-        self._tile_specs = {
-            # Левая колонка (управление)
-            "temperature": TileSpec(
-                key="temperature",
-                title="Температура",
-                unit="°C",
-                current_key="temperature_c",
-                setpoint_key="temperature_c",
-                var_name="temperature_c_var",
-                fmt="{:.1f}",
-                kind="control",
-            ),
-            "do": TileSpec(
-                key="do",
-                title="DO",
-                unit="%",
-                current_key="do_percent",
-                setpoint_key="do_setpoint",
-                var_name="do_var",
-                fmt="{:.0f}",
-                kind="control",
-            ),
-            "aeration": TileSpec(
-                key="aeration",
-                title="Аэрация",
-                unit="L/min",
-                current_key="aeration_lpm",
-                setpoint_key="aeration_lpm",
-                var_name="aeration_lpm_var",
-                fmt="{:.1f}",
-                kind="control",
-            ),
-            "ph": TileSpec(
-                key="ph",
-                title="pH",
-                unit="",
-                current_key="ph",
-                setpoint_key="ph_setpoint",
-                var_name="ph_var",
-                fmt="{:.2f}",
-                kind="control",
-            ),
-            # Центр (управление технологией)
-            "stirring": TileSpec(
-                key="stirring",
-                title="Перемешивание",
-                unit="rpm",
-                current_key="stirring_rpm",
-                setpoint_key="stirring_rpm",
-                var_name="stirring_rpm_var",
-                fmt="{:.0f}",
-                kind="control",
-            ),
-            "media_feed": TileSpec(
-                key="media_feed",
-                title="Подача среды",
-                unit="mL/h",
-                current_key="feed_rate",
-                setpoint_key="feed_rate",
-                var_name="feed_rate_var",
-                fmt="{:.1f}",
-                kind="control",
-            ),
-            "media_level": TileSpec(
-                key="media_level",
-                title="Текущий уровень среды",
-                unit="мл",
-                current_key="volume_ml",
-                setpoint_key=None,
-                var_name=None,
-                fmt="{:.0f}",
-                kind="monitor",
-            ),
-            "media_take": TileSpec(
-                key="media_take",
-                title="Отбор среды",
-                unit="mL/h",
-                current_key="harvest_rate",
-                setpoint_key="harvest_rate",
-                var_name="harvest_rate_var",
-                fmt="{:.1f}",
-                kind="control",
-            ),
-            # Правая колонка (мониторинг)
-            "biomass": TileSpec(
-                key="biomass",
-                title="Биомасса",
-                unit="×10⁶",
-                current_key="biomass",
-                fmt="{:.2f}",
-                kind="monitor",
-            ),
-            "viability": TileSpec(
-                key="viability",
-                title="Жизнеспособность",
-                unit="%",
-                current_key="viability_percent",
-                fmt="{:.0f}",
-                kind="monitor",
-            ),
-            "doubling": TileSpec(
-                key="doubling",
-                title="Удвоение",
-                unit="ч",
-                current_key="doubling_time_h",
-                fmt="{:.1f}",
-                kind="monitor",
-            ),
-            "growth_rate": TileSpec(
-                key="growth_rate",
-                title="Скорость роста",
-                unit="/ч",
-                current_key="growth_rate",
-                fmt="{:.3f}",
-                kind="monitor",
-            ),
-            "stress": TileSpec(
-                key="stress",
-                title="Стресс",
-                unit="",
-                current_key="stress",
-                fmt="{:.2f}",
-                kind="monitor",
-            ),
-            # Нижняя панель
-            "glucose": TileSpec(
-                key="glucose",
-                title="Глюкоза",
-                unit="мг/л",
-                current_key="glucose",
-                fmt="{:.0f}",
-                kind="monitor",
-            ),
-            "biomass_add": TileSpec(
-                key="biomass_add",
-                title="Добавить биомассу",
-                unit="×10⁶",
-                current_key="biomass_added_total_mln",
-                fmt="{:.2f}",
-                kind="action",
-            ),
-
-            "glucose_add": TileSpec(
-                key="glucose_add",
-                title="Добавить глюкозу",
-                unit="мг",
-                current_key="glucose_added_mg_total",
-                fmt="{:.0f}",
-                kind="action",
-            ),
+        self._tile_specs = _TILE_SPECS
+        # построители action-плиток: (w, tile_w, fill, on_click)
+        self._action_builders: Dict[str, Callable[..., None]] = {
+            'glucose_add': partial(self._build_add_tile, var=self._var_glucose_add_mg, unit='мг',
+                                   command=self._add_glucose_from_tile, with_graph=True),
+            'biomass_add': partial(self._build_add_tile, var=self._var_biomass_add_mln, unit='×10⁶',
+                                   command=self._add_biomass_from_tile),
         }
 
-    def _build_tiles_column(self, parent: tk.Frame, specs: List[TileSpec]):
-        parent.grid_columnconfigure(0, weight=0)
-        for i, spec in enumerate(specs):
-            w = self._create_tile(parent, spec)
-            w.grid(row=i, column=0, sticky='n', pady=6)
-
-    def _rounded_poly_points(self, x0: int, y0: int, x1: int, y1: int, r: int) -> list:
-        r = max(0, int(r))
-        if r*2 > (x1-x0):
-            r = max(0, (x1-x0)//2)
-        if r*2 > (y1-y0):
-            r = max(0, (y1-y0)//2)
-        return [
-            x0 + r, y0,
-            x1 - r, y0,
-            x1, y0,
-            x1, y0 + r,
-            x1, y1 - r,
-            x1, y1,
-            x1 - r, y1,
-            x0 + r, y1,
-            x0, y1,
-            x0, y1 - r,
-            x0, y0 + r,
-            x0, y0,
-        ]
-
-    def _make_rounded_card(self, parent: tk.Widget, width: int, height: int, fill: str, outline: str, radius: int = 18):
-        bg_parent = '#ffffff'
-        try:
-            bg_parent = str(parent.cget('bg'))
-        except Exception:
-            pass
-        c = tk.Canvas(parent, width=width, height=height, bg=bg_parent, highlightthickness=0)
-        pts = self._rounded_poly_points(1, 1, width - 1, height - 1, radius)
-        poly = c.create_polygon(pts, smooth=True, splinesteps=12, fill=fill, outline=outline, width=2)
+    def _dash_group(self, row: int, align: str, widths: Tuple[int, ...], gap: int) -> Tuple[str, int, List[int]]:
+        """Регистрирует группу плиток строки: возвращает тег, y и x каждой плитки."""
+        tag = f"dash_{align}{row}"
+        total = sum(widths) + gap * (len(widths) - 1)
+        x = self._dash_group_x(align, total, self._dash_w)
+        self._dash_groups.append([tag, align, total, x])
+        xs = []
+        for w in widths:
+            xs.append(x)
+            x += w + gap
+        return tag, row * (self.TILE_HEIGHT + 8), xs
+
+    @staticmethod
+    def _dash_group_x(align: str, total: int, width: int) -> int:
+        if align == "c":
+            return max(0, (width - total) // 2)
+        if align == "r":
+            return max(0, width - total)
+        return 0
+
+    def _on_dash_configure(self, e):
+        width = int(e.width)
+        if width == self._dash_w:
+            return
+        self._dash_w = width
+        c = self._dash_canvas
+        for g in self._dash_groups:
+            tag, align, total, x = g
+            nx = self._dash_group_x(align, total, width)
+            if nx != x:
+                c.move(tag, nx - x, 0)
+                g[3] = nx
+
+    def _make_rounded_card(self, c: tk.Canvas, x: int, y: int, width: int, height: int, fill: str, outline: str,
+                           radius: int = 18, tags: Any = ()):
+        """Рисует карточку на общем холсте c (полигон + окно с внутренним фреймом)."""
+        # точки кешируются по размеру; полигон строится в начале координат и сдвигается
+        pts = _rounded_poly_points(width - 2, height - 2, int(radius))
+        poly = c.create_polygon(pts, fill=fill, outline=outline, width=2, joinstyle='round', tags=tags)
+        c.move(poly, x + 1, y + 1)
         inner = tk.Frame(c, bg=fill)
         inner.grid_propagate(False)
-        c.create_window(0, 0, anchor='nw', window=inner, width=width, height=height)
+        c.create_window(x, y, anchor='nw', window=inner, width=width, height=height, tags=tags)
         return c, poly, inner
 
 
 
-    def _create_placeholder_tile(self, parent: tk.Frame, width: int, height: int) -> tk.Canvas:
+    def _create_placeholder_tile(self, c: tk.Canvas, x: int, y: int, width: int, height: int, tags: Any = ()) -> int:
         """Пустая плитка-заглушка (для выравнивания компоновки)."""
         fill = '#f7f8ff'
         outline = '#e2e6f5'
-        tile, _poly, _inner = self._make_rounded_card(parent, int(width), int(height), fill=fill, outline=outline, radius=14)
-        return tile
+        _c, poly, _inner = self._make_rounded_card(c, x, y, int(width), int(height), fill=fill, outline=outline, radius=14, tags=tags)
+        return poly
 
     def _create_button_tile(
         self,
-        parent: tk.Frame,
+        c: tk.Canvas,
+        x: int,
+        y: int,
         title: str,
         button_text: str,
         command: Optional[Callable[[], None]],
         width: int,
         height: int,
-    ) -> tk.Canvas:
+        tags: Any = (),
+    ) -> int:
         """Плитка с одной кнопкой (не участвует в выборе параметров)."""
         fill = '#f5f7ff'
         outline = '#d9def3'
-        tile, _poly, inner = self._make_rounded_card(parent, int(width), int(height), fill=fill, outline=outline, radius=14)
+        _c, poly, inner = self._make_rounded_card(c, x, y, int(width), int(height), fill=fill, outline=outline, radius=14, tags=tags)
         inner.grid_columnconfigure(0, weight=1)
 
-        tk.Label(inner, text=title, bg=fill, fg='#223', font=('Segoe UI', 10, 'bold'),
+        tk.Label(inner, text=title, bg=fill, fg=self.FG_TITLE, font=self._F_title_sm,
                  wraplength=int(width) - 22, justify='left').grid(row=0, column=0, sticky='w', padx=10, pady=(10, 8))
 
         btn = ttk.Button(inner, text=button_text, command=command if callable(command) else None)
         btn.grid(row=1, column=0, sticky='ew', padx=10, pady=(0, 10))
-        return tile
+        return poly
 
-    def _create_tile(self, parent: tk.Frame, spec: TileSpec, width: Optional[int] = None, height: Optional[int] = None) -> tk.Canvas:
+    def _create_tile(self, c: tk.Canvas, spec: TileSpec, x: int, y: int, width: Optional[int] = None,
+                     height: Optional[int] = None, tags: Any = ()) -> None:
         # размеры плитки (по умолчанию — базовые прямоугольные)
         tile_w = int(width or self.TILE_WIDTH)
         tile_h = int(height or self.TILE_HEIGHT)
@@ -1113,7 +1522,7 @@ class ExperimentDashboardPanel:
         base_bg = '#f5f7ff'
         base_br = '#d9def3'
         sel_bg = '#eaf0ff'
-        sel_br = '#5b7cff'
+        sel_br = self.ACCENT
 
         # Автоматизация - особые цвета
         auto_bg = '#f0f7ff'
@@ -1123,11 +1532,7 @@ class ExperimentDashboardPanel:
         selected_now = bool(self._selected_tile_key and self._selected_tile_key == spec.key)
 
         # Проверяем, включена ли автоматизация для этой плитки
-        is_auto = False
-        if spec.key == "ph" and getattr(self.app, 'ph_auto_co2_var', tk.BooleanVar(value=False)).get():
-            is_auto = True
-        elif spec.key == "do" and getattr(self.app, 'do_auto_aeration_var', tk.BooleanVar(value=False)).get():
-            is_auto = True
+        is_auto = self._tile_is_auto(spec.key)
 
         if is_auto:
             fill = auto_sel_bg if selected_now else auto_bg
@@ -1136,187 +1541,149 @@ class ExperimentDashboardPanel:
             fill = sel_bg if selected_now else base_bg
             outline = sel_br if selected_now else base_br
 
-        tile, poly, inner = self._make_rounded_card(parent, tile_w, tile_h, fill=fill, outline=outline, radius=18)
+        tile, poly, inner = self._make_rounded_card(c, x, y, tile_w, tile_h, fill=fill, outline=outline, radius=18, tags=tags)
 
         # Общее: клик/выбор
         def on_click(_e=None):
             self._select_tile(spec.key)
 
-        tile.bind('<Button-1>', on_click)
-
-        # --- ACTION: добавление глюкозы ---
-        if spec.kind == 'action' and spec.key == 'glucose_add':
-            inner.grid_columnconfigure(0, weight=1)
-
-            title_font = ('Segoe UI', 10, 'bold')
-            title = tk.Label(inner, text=spec.title, bg=fill, fg='#223', font=title_font,
-                             wraplength=tile_w - 22, justify='left')
-            title.grid(row=0, column=0, sticky='w', padx=10, pady=(8, 6))
-
-            # Поле ввода и единицы
-            input_frame = tk.Frame(inner, bg=fill)
-            input_frame.grid(row=1, column=0, sticky='ew', padx=10)
-            input_frame.grid_columnconfigure(0, weight=1)
-            input_frame.grid_columnconfigure(1, weight=0)
-
-            entry = ttk.Entry(input_frame, textvariable=getattr(self.app, 'glucose_add_mg_var'), width=12)
-            entry.grid(row=0, column=0, sticky='w')
-            tk.Label(input_frame, text='мг', bg=fill, fg='#556', font=('Segoe UI', 9)).grid(
-                row=0, column=1, sticky='w', padx=(6, 0)
-            )
-
-            btn = ttk.Button(inner, text='Внести', command=self._add_glucose_from_tile)
-            btn.grid(row=2, column=0, sticky='ew', padx=10, pady=(6, 0))
-
-            # Итого
-            total_var = tk.StringVar(value='Итого: 0 мг')
-            total = tk.Label(inner, textvariable=total_var, bg=fill, fg='#111', font=('Segoe UI', 10, 'bold'))
-            total.grid(row=3, column=0, sticky='w', padx=10, pady=(4, 4))
-
-            # График глюкозы (мини)
-            graph_canvas = tk.Canvas(inner, height=40, bg=fill, highlightthickness=0)
-            graph_canvas.grid(row=4, column=0, sticky='ew', padx=10, pady=(0, 8))
-
-            # bind clicks
-            for w in (inner, title, input_frame, entry, btn, total, graph_canvas):
-                try:
-                    w.bind('<Button-1>', on_click)
-                except Exception:
-                    pass
-
-            self._tile_widgets[spec.key] = {
-                'spec': spec,
-                'frame': tile,
-                'poly': poly,
-                'inner': inner,
-                'title': title,
-                'badge': None,
-                'value': None,
-                'sub': total,
-                'sub_var': total_var,
-                'graph_canvas': graph_canvas,
-                'spark': None,
-                'fill_base': base_bg,
-                'border_base': base_br,
-                'fill_sel': sel_bg,
-                'border_sel': sel_br,
-                'auto_bg': auto_bg,
-                'auto_sel_bg': auto_sel_bg,
-                'auto_br': auto_br,
-                'child_bgs': [inner, title, input_frame, total, graph_canvas],
-            }
-            self._tile_history.setdefault(spec.key, [])
-            return tile
-
-
-
-        # --- ACTION: добавление биомассы ---
-        if spec.kind == 'action' and spec.key == 'biomass_add':
-            inner.grid_columnconfigure(0, weight=1)
-
-            title_font = ('Segoe UI', 10, 'bold')
-            title = tk.Label(inner, text=spec.title, bg=fill, fg='#223', font=title_font,
-                             wraplength=tile_w - 22, justify='left')
-            title.grid(row=0, column=0, sticky='w', padx=10, pady=(8, 0))
-
-            input_frame = tk.Frame(inner, bg=fill)
-            input_frame.grid(row=1, column=0, sticky='w', padx=10, pady=(8, 0))
-            input_frame.grid_columnconfigure(0, weight=0)
-            input_frame.grid_columnconfigure(1, weight=0)
-
-            entry = ttk.Entry(input_frame, textvariable=getattr(self.app, 'biomass_add_mln_var'), width=12)
-            entry.grid(row=0, column=0, sticky='w')
-            tk.Label(input_frame, text='×10⁶', bg=fill, fg='#556', font=('Segoe UI', 9)).grid(
-                row=0, column=1, sticky='w', padx=(6, 0)
-            )
-
-            btn = ttk.Button(inner, text='Внести', command=self._add_biomass_from_tile)
-            btn.grid(row=2, column=0, sticky='ew', padx=10, pady=(6, 0))
-
-            # Итого
-            total_var = tk.StringVar(value='Итого: 0 ×10⁶')
-            total = tk.Label(inner, textvariable=total_var, bg=fill, fg='#111', font=('Segoe UI', 10, 'bold'))
-            total.grid(row=3, column=0, sticky='w', padx=10, pady=(4, 8))
+        tile.tag_bind(poly, '<Button-1>', on_click)
+
+        w = TileWidgets(
+            spec=spec,
+            frame=tile,
+            poly=poly,
+            inner=inner,
+            fill_base=base_bg,
+            border_base=base_br,
+            fill_sel=sel_bg,
+            border_sel=sel_br,
+            auto_bg=auto_bg,
+            auto_sel_bg=auto_sel_bg,
+            auto_br=auto_br,
+            last_fill=fill,
+            last_outline=outline,
+        )
+        self._tile_widgets[spec.key] = w
 
-            # мета для обновления
-            self._tile_action_meta[spec.key] = {
-                'total_var': total_var,
-                'child_bgs': [inner, title, input_frame, total],
-            }
-            self._tile_history.setdefault(spec.key, [])
-            return tile
+        # --- ACTION: отдельный построитель по ключу плитки ---
+        if spec.kind == 'action':
+            builder = self._action_builders.get(spec.key)
+            if builder is not None:
+                builder(w, tile_w, fill, on_click)
+            return
 
         # --- CONTROL/MONITOR tiles ---
         inner.grid_columnconfigure(0, weight=1)
         inner.grid_columnconfigure(1, weight=0)
 
-        t_font_size = 11
-        if len(spec.title) >= 14:
-            t_font_size = 10
+        title_font = self._F_title_sm if spec.title_small else self._F_title
 
         title = tk.Label(
-            inner, text=spec.title, bg=fill, fg='#223',
-            font=('Segoe UI', t_font_size, 'bold'),
+            inner, text=spec.title, bg=fill, fg=self.FG_TITLE,
+            font=title_font,
             wraplength=tile_w - 22, justify='left'
         )
         title.grid(row=0, column=0, sticky='w', padx=10, pady=(8, 0))
 
-        badge = tk.Label(inner, text=spec.unit or '', bg=fill, fg='#556', font=('Segoe UI', 9))
+        badge = tk.Label(inner, text=spec.unit or '', bg=fill, fg=self.FG_MUTED, font=self._F_sub)
         badge.grid(row=0, column=1, sticky='e', padx=10, pady=(8, 0))
 
-        value = tk.Label(inner, text='—', bg=fill, fg='#111', font=('Segoe UI', 18, 'bold'))
+        # Виджеты создаются один раз; текст меняется через _set_tile_text (только при изменении)
+        value = tk.Label(inner, text='—', bg=fill, fg=self.FG_VALUE, font=self._F_value)
         value.grid(row=1, column=0, sticky='w', padx=10, pady=(2, 0))
 
-        # Чекбокс автоматизации для pH и DO
-        if spec.key in ["ph", "do"]:
-            auto_frame = tk.Frame(inner, bg=fill)
-            auto_frame.grid(row=2, column=0, columnspan=2, sticky='w', padx=10, pady=(4, 0))
-
-            auto_var = getattr(self.app, f"{spec.key}_auto_co2_var" if spec.key == "ph" else f"{spec.key}_auto_aeration_var")
+        # Чекбокс автоматизации для pH и DO — прямо в inner, без промежуточного фрейма
+        if spec.key in _AUTO_VARS:
             cb = ttk.Checkbutton(
-                auto_frame, text='Авто', variable=auto_var,
-                command=lambda k=spec.key: self._update_tile_auto_style(k)
+                inner, text='Авто', variable=getattr(self.app, _AUTO_VARS[spec.key]),
+                command=lambda k=spec.key: self._queue_tile_auto_style(k)
             )
-            cb.pack(side='left')
-
-            sub = tk.Label(inner, text='', bg=fill, fg='#556', font=('Segoe UI', 9),
-                           wraplength=tile_w - 22, justify='left')
-            sub.grid(row=3, column=0, columnspan=2, sticky='w', padx=10, pady=(0, 4))
+            cb.grid(row=2, column=0, columnspan=2, sticky='w', padx=10, pady=(4, 0))
+            sub_row, sub_pady = 3, (0, 4)
         else:
-            sub = tk.Label(inner, text='', bg=fill, fg='#556', font=('Segoe UI', 9),
-                           wraplength=tile_w - 22, justify='left')
-            sub.grid(row=2, column=0, columnspan=2, sticky='w', padx=10, pady=(0, 6))
+            sub_row, sub_pady = 2, (0, 6)
+
+        # у мониторинговых плиток подпись постоянная
+        sub = tk.Label(inner, text='Мониторинг' if spec.kind == 'monitor' else '', bg=fill, fg=self.FG_MUTED,
+                       font=self._F_sub, wraplength=tile_w - 22, justify='left')
+        sub.grid(row=sub_row, column=0, columnspan=2, sticky='w', padx=10, pady=sub_pady)
 
         spark = tk.Canvas(inner, height=30, bg=fill, highlightthickness=0)
         spark.grid(row=4, column=0, columnspan=2, sticky='ew', padx=10, pady=(0, 8))
+        spark.bind('<Configure>', lambda e, tw=w: self._on_spark_configure(tw, e))
 
-        for w in (inner, title, badge, value, sub, spark):
+        for ww in (inner, title, badge, value, sub, spark):
             try:
-                w.bind('<Button-1>', on_click)
+                ww.bind('<Button-1>', on_click)
             except Exception:
                 pass
 
-        self._tile_widgets[spec.key] = {
-            'spec': spec,
-            'frame': tile,
-            'poly': poly,
-            'inner': inner,
-            'title': title,
-            'badge': badge,
-            'value': value,
-            'sub': sub,
-            'spark': spark,
-            'fill_base': base_bg,
-            'border_base': base_br,
-            'fill_sel': sel_bg,
-            'border_sel': sel_br,
-            'auto_bg': auto_bg,
-            'auto_sel_bg': auto_sel_bg,
-            'auto_br': auto_br,
-            'child_bgs': [inner, title, badge, value, sub, spark],
-        }
-        self._tile_history.setdefault(spec.key, [])
-        return tile
+        w.title = title
+        w.badge = badge
+        w.value = value
+        w.sub = sub
+        w.spark = spark
+        w.child_bgs = [inner, title, badge, value, sub, spark]
+        w.hist = self._tile_history.setdefault(spec.key, deque(maxlen=_TILE_HISTORY_LEN))
+        self._tile_list.append(w)
+
+    def _build_add_tile(self, w: TileWidgets, tile_w: int, fill: str, on_click: Callable[..., None], *,
+                        var: tk.Variable, unit: str, command: Callable[[], None], with_graph: bool = False):
+        """Плитка «Добавить ...»: поле ввода с единицами, кнопка «Внести», строка «Итого», опц. мини-график."""
+        inner = w.inner
+        inner.grid_columnconfigure(0, weight=1)
+
+        title = tk.Label(inner, text=w.spec.title, bg=fill, fg=self.FG_TITLE, font=self._F_title_sm,
+                         wraplength=tile_w - 22, justify='left')
+        title.grid(row=0, column=0, sticky='w', padx=10, pady=(8, 6) if with_graph else (8, 0))
+
+        # Поле ввода и единицы
+        input_frame = tk.Frame(inner, bg=fill)
+        input_frame.grid(row=1, column=0, sticky='w', padx=10, pady=0 if with_graph else (8, 0))
+
+        entry = ttk.Entry(input_frame, textvariable=var, width=12)
+        entry.grid(row=0, column=0, sticky='w')
+        unit_lbl = tk.Label(input_frame, text=unit, bg=fill, fg=self.FG_MUTED, font=self._F_sub)
+        unit_lbl.grid(row=0, column=1, sticky='w', padx=(6, 0))
+
+        btn = ttk.Button(inner, text='Внести', command=command)
+        btn.grid(row=2, column=0, sticky='ew', padx=10, pady=(6, 0))
+
+        # Итого
+        total = tk.Label(inner, text=f'Итого: 0 {unit}', bg=fill, fg=self.FG_VALUE, font=self._F_title_sm)
+        total.grid(row=3, column=0, sticky='w', padx=10, pady=(4, 4) if with_graph else (4, 8))
+
+        widgets = [inner, title, input_frame, unit_lbl, total]
+        if with_graph:
+            # График глюкозы (мини)
+            graph_canvas = tk.Canvas(inner, height=40, bg=fill, highlightthickness=0)
+            graph_canvas.grid(row=4, column=0, sticky='ew', padx=10, pady=(0, 8))
+            graph_canvas.bind('<Configure>', self._on_glucose_graph_configure)
+            w.graph_canvas = graph_canvas
+            widgets.append(graph_canvas)
+
+        for ww in widgets + [entry, btn]:
+            try:
+                ww.bind('<Button-1>', on_click)
+            except Exception:
+                pass
+
+        w.title = title
+        w.sub = total
+        w.child_bgs = widgets
+
+    def _queue_tile_auto_style(self, tile_key: str):
+        """Откладывает перекраску плитки до простоя (повторные клики сливаются)."""
+        if tile_key in self._style_pending:
+            return
+        self._style_pending.add(tile_key)
+        self.parent.after_idle(self._flush_tile_auto_styles)
+
+    def _flush_tile_auto_styles(self):
+        pending, self._style_pending = self._style_pending, set()
+        for key in pending:
+            self._update_tile_auto_style(key)
 
     def _update_tile_auto_style(self, tile_key: str):
         """Обновление стиля плитки при включении/выключении автоматизации"""
@@ -1324,59 +1691,55 @@ class ExperimentDashboardPanel:
             return
         
         w = self._tile_widgets[tile_key]
-        spec = w['spec']
+        spec = w.spec
         selected_now = bool(self._selected_tile_key and self._selected_tile_key == tile_key)
         
         # Проверяем, включена ли автоматизация
-        is_auto = False
-        if tile_key == "ph" and getattr(self.app, 'ph_auto_co2_var', tk.BooleanVar(value=False)).get():
-            is_auto = True
-        elif tile_key == "do" and getattr(self.app, 'do_auto_aeration_var', tk.BooleanVar(value=False)).get():
-            is_auto = True
-        
+        is_auto = self._tile_is_auto(tile_key)
+
         # Обновляем цвета
         if is_auto:
-            fill = w['auto_sel_bg'] if selected_now else w['auto_bg']
-            outline = w['auto_br'] if selected_now else w['auto_br']
+            fill = w.auto_sel_bg if selected_now else w.auto_bg
+            outline = w.auto_br
         else:
-            fill = w['fill_sel'] if selected_now else w['fill_base']
-            outline = w['border_sel'] if selected_now else w['border_base']
-        
-        try:
-            c = w['frame']
-            poly = w['poly']
-            if c is not None and poly is not None:
-                c.itemconfigure(poly, fill=fill, outline=outline)
-        except Exception:
-            pass
-        
-        # Обновление фонов вложенных виджетов
+            fill = w.fill_sel if selected_now else w.fill_base
+            outline = w.border_sel if selected_now else w.border_base
+
+        self._paint_tile(w, fill, outline)
+
+    def _tile_is_auto(self, key: str) -> bool:
+        """Включена ли автоматика плитки (без создания временных BooleanVar)."""
+        name = _AUTO_VARS.get(key)
+        v = getattr(self.app, name, None) if name else None
+        return bool(v is not None and v.get())
+
+    def _paint_tile(self, w: TileWidgets, fill: str, outline: str):
+        """Перекрашивает карточку и фоны вложенных виджетов, только если цвета изменились."""
+        if w.last_fill == fill and w.last_outline == outline:
+            return
         try:
-            for ww in w.get('child_bgs', []) or []:
-                try:
-                    ww.configure(bg=fill)
-                except Exception:
-                    pass
+            w.frame.itemconfigure(w.poly, fill=fill, outline=outline)
+            for ww in w.child_bgs:
+                ww.configure(bg=fill)
         except Exception:
-            pass
+            return
+        w.last_fill = fill
+        w.last_outline = outline
 
     def _add_glucose_from_tile(self):
         try:
-            mg = float(getattr(self.app, 'glucose_add_mg_var').get())
-        except Exception:
+            mg = float(self._var_glucose_add_mg.get())
+        except (tk.TclError, ValueError):
             mg = 0.0
         if mg <= 0:
             return
-        try:
-            fn = getattr(self.app, 'add_glucose_mg', None)
-            if callable(fn):
+        fn = getattr(self.app, 'add_glucose_mg', None)
+        if callable(fn):
+            try:
                 fn(mg)
-        except Exception:
-            pass
-        try:
-            getattr(self.app, 'glucose_add_mg_var').set(0.0)
-        except Exception:
-            pass
+            except Exception:
+                pass
+        self._var_glucose_add_mg.set(0.0)
 
 
     def _add_biomass_from_tile(self) -> None:
@@ -1384,46 +1747,34 @@ class ExperimentDashboardPanel:
         if not self.app:
             return
         try:
-            mln = float(getattr(self.app, "biomass_add_mln_var").get())
-        except Exception:
+            mln = float(self._var_biomass_add_mln.get())
+        except (tk.TclError, ValueError):
             mln = 0.0
         if mln <= 0:
             return
-        try:
-            # В workspace_app реализовано add_biomass_mln (добавление к текущей биомассе)
-            if hasattr(self.app, "add_biomass_mln"):
-                self.app.add_biomass_mln(mln)
-        except Exception:
-            pass
-        try:
-            getattr(self.app, "biomass_add_mln_var").set(0.0)
-        except Exception:
-            pass
+        # В workspace_app реализовано add_biomass_mln (добавление к текущей биомассе)
+        fn = getattr(self.app, "add_biomass_mln", None)
+        if callable(fn):
+            try:
+                fn(mln)
+            except Exception:
+                pass
+        self._var_biomass_add_mln.set(0.0)
 
     def _update_biomass_add_tile(self) -> None:
         """Обновление текста 'Итого' в плитке добавления биомассы."""
-        meta = self._tile_action_meta.get("biomass_add")
-        if not meta:
+        w = self._tile_widgets.get("biomass_add")
+        if not w:
             return
-        try:
-            rt = getattr(self.app, "runtime_settings", {}) or {}
-        except Exception:
-            rt = {}
+        rt = getattr(self.app, "runtime_settings", None) or {}
         # Предпочитаем runtime_settings, но поддерживаем tk.Variable
-        total_mln = None
-        try:
-            total_mln = float(rt.get("biomass_added_total_mln", None))
-        except Exception:
-            total_mln = None
+        total_mln = _safe_float(rt.get("biomass_added_total_mln"), None)
         if total_mln is None:
             try:
-                total_mln = float(getattr(self.app, "biomass_added_total_mln_var").get())
-            except Exception:
+                total_mln = float(self._var_biomass_added_total_mln.get())
+            except (tk.TclError, ValueError):
                 total_mln = 0.0
-        try:
-            meta["total_var"].set(f"Итого: {total_mln:.2f} ×10⁶")
-        except Exception:
-            pass
+        self._set_tile_text(w, "sub", f"Итого: {total_mln:.2f} ×10⁶")
 
 
     def _update_glucose_tile(self):
@@ -1433,125 +1784,113 @@ class ExperimentDashboardPanel:
         
         # Обновляем итоговую сумму
         try:
-            total = float(getattr(self.app, 'glucose_added_total_mg_var').get())
-        except Exception:
-            try:
-                total = float((getattr(self.app, 'runtime_settings', {}) or {}).get('glucose_added_mg_total', 0.0) or 0.0)
-            except Exception:
-                total = 0.0
-        try:
-            if 'sub_var' in w and w['sub_var'] is not None:
-                w['sub_var'].set(f'Итого: {total:.0f} мг')
-        except Exception:
-            pass
+            total = float(self._var_glucose_added_total_mg.get())
+        except (tk.TclError, ValueError):
+            rt = getattr(self.app, 'runtime_settings', None) or {}
+            total = _safe_float(rt.get('glucose_added_mg_total'), 0.0)
+        self._set_tile_text(w, 'sub', f'Итого: {total:.0f} мг')
         
         # Обновляем график глюкозы
-        if 'graph_canvas' in w:
-            self._draw_glucose_graph(w['graph_canvas'])
+        if w.graph_canvas is not None:
+            self._draw_glucose_graph(w.graph_canvas)
+
+    def _on_glucose_graph_configure(self, e):
+        w = max(1, int(e.width))
+        h = max(1, int(e.height))
+        self._glucose_graph_size = (w, h)
+        ids = self._glucose_graph_items
+        if ids is None:
+            return
+        c = e.widget
+        c.coords(ids[1], 2, 2)
+        c.coords(ids[2], 2, h - 2)
+        c.coords(ids[3], w - 2, 2)
 
     def _draw_glucose_graph(self, canvas: tk.Canvas):
-        """Рисует мини-график глюкозы и биомассы"""
-        try:
-            canvas.delete('all')
-            w = int(canvas.winfo_width() or 1)
-            h = int(canvas.winfo_height() or 1)
-        except Exception:
-            return
-        
+        """Рисует мини-график глюкозы.
+
+        Элементы холста создаются один раз, далее меняются только их координаты и текст.
+        """
         if len(self._glucose_history) < 2 or len(self._biomass_history) < 2:
             return
-        
+        w, h = self._glucose_graph_size
+
         # Берем последние 20 точек
-        glucose_points = self._glucose_history[-20:]
-        biomass_points = self._biomass_history[-20:]
-        
-        if len(glucose_points) < 2:
+        hist = self._glucose_history
+        n = min(20, len(hist))
+        window = tuple(g for _, g in islice(hist, len(hist) - n, None))
+        sig = (window, (w, h))
+        if sig == self._glucose_graph_sig:
             return
-        
-        # Находим диапазоны
-        glucose_vals = [g for _, g in glucose_points]
-        biomass_vals = [b for _, b in biomass_points]
-        
-        g_min, g_max = min(glucose_vals), max(glucose_vals)
-        b_min, b_max = min(biomass_vals), max(biomass_vals)
-        
-        if g_max - g_min < 1e-9:
-            g_max = g_min + 1.0
-        if b_max - b_min < 1e-9:
-            b_max = b_min + 1.0
-        
-        # Рисуем график глюкозы
+        vals = np.array(window, dtype=np.float64)
+
+        # Находим диапазон
+        g_min, g_max = _min_max(vals)
+
+        # График глюкозы: точки считаются векторно, в Tk уходит плоский список x, y, ...
         pad = 5
-        n = len(glucose_points)
         dx = (w - 2 * pad) / max(1, (n - 1))
-        
-        pts_glucose = []
-        for i, (_, v) in enumerate(glucose_points):
-            x = pad + i * dx
-            y = h - pad - ((v - g_min) / (g_max - g_min)) * (h - 2 * pad)
-            pts_glucose.extend([x, y])
-        
-        if len(pts_glucose) >= 4:
-            canvas.create_line(pts_glucose, width=2, smooth=True, fill='#5b7cff')
-        
-        # Подписи
-        try:
-            canvas.create_text(2, 2, text=f"{g_max:.0f}", anchor='nw', fill='#666', font=('Segoe UI', 7))
-            canvas.create_text(2, h-2, text=f"{g_min:.0f}", anchor='sw', fill='#666', font=('Segoe UI', 7))
-            canvas.create_text(w-2, 2, text=f"глюкоза", anchor='ne', fill='#5b7cff', font=('Segoe UI', 7))
+        xs = pad + np.arange(n) * dx
+        ys = (h - pad) - (vals - g_min) * ((h - 2 * pad) / (g_max - g_min))
+        pts_glucose = np.column_stack((xs, ys)).ravel().tolist()
+
+        try:
+            ids = self._glucose_graph_items
+            if ids is None:
+                line = canvas.create_line(pts_glucose, width=2, smooth=True, fill=self.ACCENT)
+                # Подписи
+                t_max = canvas.create_text(2, 2, text=f"{g_max:.0f}", anchor='nw', fill='#666', font=self._F_tiny)
+                t_min = canvas.create_text(2, h-2, text=f"{g_min:.0f}", anchor='sw', fill='#666', font=self._F_tiny)
+                t_name = canvas.create_text(w-2, 2, text="глюкоза", anchor='ne', fill=self.ACCENT, font=self._F_tiny)
+                self._glucose_graph_items = (line, t_max, t_min, t_name)
+            else:
+                canvas.coords(ids[0], pts_glucose)
+                canvas.itemconfigure(ids[1], text=f"{g_max:.0f}")
+                canvas.itemconfigure(ids[2], text=f"{g_min:.0f}")
         except Exception:
-            pass
+            return
+        self._glucose_graph_sig = sig
 
 
 
     def _build_center_visual(self, parent: tk.Frame):
-        parent.grid_rowconfigure(0, weight=1)
-        parent.grid_columnconfigure(0, weight=1)
-
-        holder = tk.Frame(parent, bg="#ffffff")
-        holder.grid(row=0, column=0, sticky="nsew")
-        holder.grid_rowconfigure(0, weight=1)
-        holder.grid_columnconfigure(0, weight=1)
-
-        # фиксированный размер визуализации емкости 300x300, по центру
-        self._reactor = tk.Canvas(holder, width=300, height=300, bg="#ffffff", highlightthickness=0)
-        self._reactor.place(relx=0.5, rely=0.5, anchor="center")
-
-    def _build_gas_tiles(self, parent: tk.Frame):
-        """Отдельные плитки O2 / CO2 / N2 в одну линию."""
-        parent.grid_columnconfigure(0, weight=1)
-        row = tk.Frame(parent, bg="#ffffff")
-        row.grid(row=0, column=0, sticky="n", pady=0)
-        for c in range(3):
-            row.grid_columnconfigure(c, weight=1)
-
-        gases = [
-            ("O₂", "o2", "#ff6b6b"),
-            ("CO₂", "co2", "#4ecdc4"),
-            ("N₂", "n2", "#45b7d1"),
-        ]
-        for i, (name, key, color) in enumerate(gases):
-            self._create_gas_tile(row, name, key, color, col=i, width=112, height=112)
+        # фиксированный размер визуализации емкости 300x300; ячейка растягивается,
+        # холст без sticky остаётся по центру
+        self._reactor = tk.Canvas(parent, width=300, height=300, bg="#ffffff", highlightthickness=0)
+        self._reactor.grid(row=1, column=0, columnspan=3, pady=(0, 8))
+        self._reactor.bind("<Configure>", self._on_reactor_configure)
+        # элементы емкости (тег "reactor") создаются сразу и скрытыми — до первого известного размера;
+        # _draw_reactor их только показывает/скрывает, двигает и меняет текст
+        c = self._reactor
+        self._reactor_items = (
+            c.create_rectangle(0, 0, 1, 1, outline=self.VESSEL_OUTLINE, width=2, fill=self.VESSEL_FILL,
+                               state="hidden", tags="reactor"),
+            c.create_rectangle(0, 0, 1, 1, outline="", fill=self.ACCENT, state="hidden", tags="reactor"),
+            c.create_text(0, 0, text="Биореактор", fill=self.FG_TITLE, font=self._F_title, state="hidden", tags="reactor"),
+            c.create_text(0, 0, text="", fill=self.FG_TITLE, font=self._F_text, state="hidden", tags="reactor"),
+        )
 
+    def _on_reactor_configure(self, e):
+        self._reactor_size = (int(e.width), int(e.height))
+        self._draw_reactor()
 
-    def _create_gas_tile(self, parent: tk.Frame, name: str, key: str, color: str, col: int, width: int = 112, height: int = 112):
+    def _create_gas_tile(self, c: tk.Canvas, name: str, key: str, color: str, x: int, y: int,
+                         width: int = 112, height: int = 112, tags: Any = ()):
         """Создание плитки для одного газа."""
         base_bg = '#f5f7ff'
         base_br = '#d9def3'
 
-        tile, poly, inner = self._make_rounded_card(parent, int(width), int(height), fill=base_bg, outline=base_br, radius=14)
-        tile.grid(row=0, column=col, sticky='n', padx=4)
+        tile, poly, inner = self._make_rounded_card(c, x, y, int(width), int(height), fill=base_bg, outline=base_br, radius=14, tags=tags)
 
         inner.grid_columnconfigure(0, weight=1)
 
         # Название газа
-        tk.Label(inner, text=name, bg=base_bg, fg='#223', font=('Segoe UI', 10, 'bold')).grid(
+        tk.Label(inner, text=name, bg=base_bg, fg=self.FG_TITLE, font=self._F_title_sm).grid(
             row=0, column=0, sticky='w', padx=8, pady=(8, 2)
         )
 
         # Текущее значение
-        cur_var = tk.StringVar(value='— %')
-        cur_label = tk.Label(inner, textvariable=cur_var, bg=base_bg, fg=color, font=('Segoe UI', 12, 'bold'))
+        cur_label = tk.Label(inner, text='— %', bg=base_bg, fg=color, font=self._F_header)
         cur_label.grid(row=1, column=0, sticky='w', padx=8, pady=(0, 2))
 
         # Поле для уставки
@@ -1565,19 +1904,19 @@ class ExperimentDashboardPanel:
         btn.grid(row=3, column=0, sticky='ew', padx=8, pady=(2, 8))
 
         # Сохраняем ссылки
-        setattr(self, f'_gas_{key}_cur', cur_var)
-        setattr(self, f'_gas_{key}_set', set_var)
-
-        self._tile_widgets[f'gas_{key}'] = {
-            'canvas': tile,
-            'poly': poly,
-            'inner': inner,
-            'cur_var': cur_var,
-            'set_var': set_var,
-            'color': color,
-            'fill': base_bg,
-            'outline': base_br
-        }
+        w = TileWidgets(
+            spec=None,
+            frame=tile,
+            poly=poly,
+            inner=inner,
+            value=cur_label,
+            fill_base=base_bg,
+            border_base=base_br,
+            last_fill=base_bg,
+            last_outline=base_br,
+        )
+        self._tile_widgets[f'gas_{key}'] = w
+        self._gas_refs.append((key.upper(), w, set_var))
 
     def _apply_single_gas(self, gas_key: str, set_var: tk.DoubleVar):
         """Применить уставку для одного газа"""
@@ -1589,93 +1928,75 @@ class ExperimentDashboardPanel:
         # Обновляем общий конфиг
         cfg = getattr(self.app, 'gases_config', {}).copy()
         cfg[gas_key.upper()] = max(0.0, min(100.0, value))
-        
-        # Нормализуем
-        total = sum(cfg.values())
-        if total > 100.0:
-            for k in cfg:
-                cfg[k] = cfg[k] / total * 100.0
-        
+        cfg = self._normalize_gases(cfg)
         self.app.gases_config = cfg
         
         # Если эксперимент идет — применяем runtime
         running = bool(getattr(self.app, '_experiment_running', False))
-        if running and hasattr(self.app, 'set_runtime_gases_config_staged'):
+        stage = self._app_fns['set_runtime_gases_config_staged']
+        if running and stage is not None:
             try:
-                self.app.set_runtime_gases_config_staged(cfg)
-                self.app.apply_runtime_gases()
+                stage(cfg)
+                self._call_app('apply_runtime_gases')
             except Exception:
                 pass
         else:
             self._apply_settings()
 
+    @staticmethod
+    def _normalize_gases(cfg: Dict[str, float]) -> Dict[str, float]:
+        """Пропорционально ужимает смесь, если сумма долей больше 100 % (новый словарь)."""
+        total = math.fsum(cfg.values())
+        if total <= 100.0:
+            return cfg
+        scale = 100.0 / total
+        return {k: v * scale for k, v in cfg.items()}
+
     # ---------------------- actions (settings/runtime) ----------------------
 
     def _apply_settings(self):
         """Применить настройки панели."""
         # Обновляем gases_config из отдельных плиток газа
         cfg = {}
-        for key in ['o2', 'co2', 'n2']:
+        for gkey, _w, var in self._gas_refs:
             try:
-                var = getattr(self, f'_gas_{key}_set', None)
-                if var is not None:
-                    cfg[key.upper()] = float(var.get())
-            except Exception:
+                cfg[gkey] = float(var.get())
+            except (tk.TclError, ValueError):
                 pass
         
         if cfg:
-            # Нормализация
-            total = sum(cfg.values())
-            if total > 100.0:
-                for k in cfg:
-                    cfg[k] = cfg[k] / total * 100.0
-            self.app.gases_config = cfg
+            self.app.gases_config = self._normalize_gases(cfg)
         
         # Применение снимка (applied/runtime) через WorkspaceApp
+        self._call_app('apply_settings')
+        self._call_app('add_log_entry', 'Настройки эксперимента применены (дашборд)', 'INFO')
+
+    def _call_app(self, name: str, *args: Any) -> bool:
+        """Вызывает метод app из кеша _app_fns; ошибки метода не пробрасываются в UI.
+
+        Возвращает False, если вызов не удался или метода нет.
+        """
+        fn = self._app_fns.get(name)
+        if fn is None:
+            return False
         try:
-            fn = getattr(self.app, 'apply_settings', None)
-            if callable(fn):
-                fn()
-        except Exception:
-            pass
-        
-        try:
-            self.app.add_log_entry('Настройки эксперимента применены (дашборд)', 'INFO')
+            fn(*args)
         except Exception:
-            pass
+            return False
+        return True
 
     def _reset_runtime_to_applied(self):
         """Сброс runtime к applied (делегируется в WorkspaceApp)."""
-        try:
-            fn = getattr(self.app, 'reset_runtime_to_applied', None)
-            if callable(fn):
-                fn()
-        except Exception:
-            pass
+        self._call_app('reset_runtime_to_applied')
 
     def _start(self):
-        try:
-            fn = getattr(self.app, 'start_simulation', None)
-            if callable(fn):
-                fn()
-        except Exception:
-            pass
+        self._call_app('start_simulation')
 
     def _pause(self):
-        try:
-            fn = getattr(self.app, 'toggle_pause_simulation', None)
-            if callable(fn):
-                fn()
-        except Exception:
-            pass
+        self._call_app('toggle_pause_simulation')
 
     def _stop(self):
-        try:
-            fn = getattr(self.app, 'stop_simulation', None)
-            if callable(fn):
-                fn()
-        except Exception:
-            pass
+        self._call_app('stop_simulation')
 
     def _update_gas_tiles(self):
         """Обновление плиток газа"""
@@ -1683,49 +2004,44 @@ class ExperimentDashboardPanel:
         gsrc = getattr(self.app, 'runtime_gases_config', None) if running else getattr(self.app, 'gases_config', None)
         gsrc = gsrc or {}
         
-        for key in ['o2', 'co2', 'n2']:
+        for gkey, w, _var in self._gas_refs:
             try:
-                cur_var = getattr(self, f'_gas_{key}_cur', None)
-                if cur_var is not None:
-                    value = gsrc.get(key.upper(), 0.0)
-                    cur_var.set(f'{float(value):.1f} %')
-            except Exception:
-                pass
+                text = f'{float(gsrc.get(gkey, 0.0)):.1f} %'
+            except (TypeError, ValueError):
+                continue
+            self._set_tile_text(w, 'value', text)
+
+    def _get_ctrl_refs(self) -> Dict[str, Any]:
+        """Переменные app для регуляторов (getattr один раз, отсутствующие — None)."""
+        refs = self._ctrl_refs
+        if refs is None:
+            app = self.app
+            refs = self._ctrl_refs = {k: getattr(app, name, None) for k, name in _CTRL_ATTRS.items()}
+        return refs
 
     def _ph_auto_controller_tick(self):
         if not self.app:
             return
-        try:
-            rt = getattr(self.app, "runtime_settings", {}) or {}
-        except Exception:
-            rt = {}
+        refs = self._get_ctrl_refs()
 
         # Включение автоматизации
-        try:
-            enabled = bool(getattr(self.app, "ph_auto_var").get())
-        except Exception:
-            enabled = False
-        if not enabled:
+        auto = refs["ph_auto"]
+        if auto is None or not auto.get():
             return
+        rt = getattr(self.app, "runtime_settings", None) or {}
 
-        # Текущее и уставка pH
-        try:
-            ph_cur = float(rt.get("ph", getattr(self.app, "ph_var").get()))
-        except Exception:
-            ph_cur = 7.0
-        try:
-            ph_sp = float(rt.get("ph_setpoint", getattr(self.app, "ph_var").get()))
-        except Exception:
-            ph_sp = ph_cur
+        # Текущее и уставка pH; нечисловое runtime-значение прерывает тик (общий try — в _refresh),
+        # переменная pH из UI читается только при отсутствии ключа
+        ph_cur = float(rt["ph"]) if "ph" in rt else _var_float(self._var_ph, 7.0)
+        ph_sp = float(rt["ph_setpoint"]) if "ph_setpoint" in rt else _var_float(self._var_ph, ph_cur)
 
-        # Текущий состав газа
-        try:
-            o2 = float(getattr(self.app, "o2_percent_var").get())
-        except Exception:
+        # Текущий состав газа: из полей ввода, при недописанном вводе — из runtime
+        co2_var, n2_var = refs["co2"], refs["n2"]
+        o2 = _var_float(refs["o2"], None)
+        if o2 is None:
             o2 = float(rt.get("o2_percent", 21.0) or 21.0)
-        try:
-            co2 = float(getattr(self.app, "co2_percent_var").get())
-        except Exception:
+        co2 = _var_float(co2_var, None)
+        if co2 is None:
             co2 = float(rt.get("co2_percent", 0.04) or 0.04)
 
         # Ошибка: если pH выше уставки — увеличиваем CO2 (CO2 снижает pH)
@@ -1739,18 +2055,12 @@ class ExperimentDashboardPanel:
             dt = max(0.2, min(5.0, now - last))
         self._ph_last_ts = now
 
-        # PI-регулятор
-        Kp = 1.2   # %CO2 на единицу pH
-        Ki = 0.25  # %CO2 на единицу pH * сек
-        i = float(getattr(self, "_ph_i", 0.0) or 0.0)
-        i = i + err * dt
-        # анти-виндап: ограничим интегратор
-        i = max(-10.0, min(10.0, i))
-        self._ph_i = i
-
-        delta = (Kp * err) + (Ki * i)
-        # ограничение скорости изменения CO2
-        delta = max(-0.3, min(0.3, delta))
+        # PI-регулятор: Kp=1.2 %CO2 на единицу pH, Ki=0.25 %CO2 на единицу pH*сек;
+        # интегратор ±10, скорость изменения CO2 ±0.3 за шаг
+        self._ph_i, delta = _pi_step(
+            err, float(getattr(self, "_ph_i", 0.0) or 0.0), dt,
+            1.2, 0.25, -10.0, 10.0, -0.3, 0.3,
+        )
 
         new_co2 = max(0.0, min(15.0, co2 + delta))
         # нормируем N2 так, чтобы сумма была 100
@@ -1761,44 +2071,31 @@ class ExperimentDashboardPanel:
             new_co2 = max(0.0, 100.0 - new_o2)
             n2 = 0.0
 
-        try:
-            # обновляем UI-переменные
-            getattr(self.app, "co2_percent_var").set(float(new_co2))
-            getattr(self.app, "n2_percent_var").set(float(n2))
-        except Exception:
-            pass
-        try:
-            if hasattr(self.app, "apply_runtime_parameter"):
-                self.app.apply_runtime_parameter("co2_percent", float(new_co2))
-                self.app.apply_runtime_parameter("n2_percent", float(n2))
-        except Exception:
-            pass
+        # обновляем UI-переменные
+        if co2_var is not None:
+            co2_var.set(float(new_co2))
+        if n2_var is not None:
+            n2_var.set(float(n2))
+        apply_rt = self._app_fns["apply_runtime_parameter"]
+        if apply_rt is not None:
+            apply_rt("co2_percent", float(new_co2))
+            apply_rt("n2_percent", float(n2))
 
     def _do_auto_controller_tick(self):
         if not self.app:
             return
-        try:
-            rt = getattr(self.app, "runtime_settings", {}) or {}
-        except Exception:
-            rt = {}
+        refs = self._get_ctrl_refs()
 
         # Включение автоматизации
-        try:
-            enabled = bool(getattr(self.app, "do_auto_var").get())
-        except Exception:
-            enabled = False
-        if not enabled:
+        auto = refs["do_auto"]
+        if auto is None or not auto.get():
             return
+        rt = getattr(self.app, "runtime_settings", None) or {}
 
-        # Текущее и уставка DO
-        try:
-            do_cur = float(rt.get("do_percent", 0.0) or 0.0)
-        except Exception:
-            do_cur = 0.0
-        try:
-            do_sp = float(rt.get("do_setpoint", getattr(self.app, "do_var").get()))
-        except Exception:
-            do_sp = float(getattr(self.app, "do_var").get() if hasattr(self.app, "do_var") else 100.0)
+        # Текущее и уставка DO; нечисловое runtime-значение прерывает тик (общий try — в _refresh),
+        # переменная DO из UI читается только при отсутствии ключа
+        do_cur = float(rt.get("do_percent", 0.0) or 0.0)
+        do_sp = float(rt["do_setpoint"]) if "do_setpoint" in rt else _var_float(self._var_do, do_cur)
 
         err = do_sp - do_cur
 
@@ -1811,35 +2108,31 @@ class ExperimentDashboardPanel:
         self._do_last_ts = now
 
         # Текущая аэрация
-        try:
-            aer = float(getattr(self.app, "aeration_var").get())
-        except Exception:
+        aer_var = refs["aer"]
+        aer = _var_float(aer_var, None)
+        if aer is None:
             aer = float(rt.get("aeration_lpm", 0.0) or 0.0)
 
-        # PI-регулятор для аэрации
-        Kp = 0.03  # L/min на %DO
-        Ki = 0.004 # L/min на %DO*сек
-        i = float(getattr(self, "_do_i", 0.0) or 0.0)
-        i = i + err * dt
-        i = max(-500.0, min(500.0, i))
-        self._do_i = i
-
-        delta = (Kp * err) + (Ki * i)
-        # ограничение скорости изменения
-        delta = max(-0.4, min(0.4, delta))
+        # PI-регулятор для аэрации: Kp=0.03 L/min на %DO, Ki=0.004 L/min на %DO*сек;
+        # интегратор ±500, скорость изменения ±0.4 за шаг
+        self._do_i, delta = _pi_step(
+            err, float(getattr(self, "_do_i", 0.0) or 0.0), dt,
+            0.03, 0.004, -500.0, 500.0, -0.4, 0.4,
+        )
 
         new_aer = aer + delta
         new_aer = max(0.0, min(10.0, new_aer))
 
-        try:
-            getattr(self.app, "aeration_var").set(float(new_aer))
-        except Exception:
-            pass
-        try:
-            if hasattr(self.app, "apply_runtime_parameter"):
-                self.app.apply_runtime_parameter("aeration_lpm", float(new_aer))
-        except Exception:
-            pass
+        if aer_var is not None:
+            aer_var.set(float(new_aer))
+        apply_rt = self._app_fns["apply_runtime_parameter"]
+        if apply_rt is not None:
+            apply_rt("aeration_lpm", float(new_aer))
+
+    def _ensure_details_panel(self):
+        if not self._details_built:
+            self._details_built = True
+            self._build_details_panel()
 
     def _build_details_panel(self):
         self._details.grid_rowconfigure(0, weight=0)
@@ -1850,9 +2143,9 @@ class ExperimentDashboardPanel:
         hdr.grid(row=0, column=0, sticky="ew", padx=12, pady=(10, 6))
         hdr.grid_columnconfigure(0, weight=1)
 
-        self._details_title = tk.Label(hdr, text="Параметр: —", bg="#f9f9f9", fg="#222", font=("Segoe UI", 10, "bold"))
+        self._details_title = tk.Label(hdr, text="Параметр: —", bg="#f9f9f9", fg="#222", font=self._F_title_sm)
         self._details_title.grid(row=0, column=0, sticky="w")
-        self._details_hint = tk.Label(hdr, text="", bg="#f9f9f9", fg="#666", font=("Segoe UI", 9))
+        self._details_hint = tk.Label(hdr, text="", bg="#f9f9f9", fg="#666", font=self._F_sub)
         self._details_hint.grid(row=1, column=0, sticky="w")
 
         body = tk.Frame(self._details, bg="#f9f9f9")
@@ -1862,8 +2155,8 @@ class ExperimentDashboardPanel:
         # факт (всегда)
         row0 = tk.Frame(body, bg="#f9f9f9")
         row0.grid(row=0, column=0, sticky="ew")
-        tk.Label(row0, text="Факт", bg="#f9f9f9", fg="#333", font=("Segoe UI", 9)).grid(row=0, column=0, sticky="w")
-        self._det_actual = tk.Label(row0, text="—", bg="#f9f9f9", fg="#111", font=("Segoe UI", 11, "bold"))
+        tk.Label(row0, text="Факт", bg="#f9f9f9", fg="#333", font=self._F_sub).grid(row=0, column=0, sticky="w")
+        self._det_actual = tk.Label(row0, text="—", bg="#f9f9f9", fg="#111", font=self._F_title)
         self._det_actual.grid(row=1, column=0, sticky="w", pady=(2, 0))
 
         # режимы: управление / график
@@ -1872,17 +2165,17 @@ class ExperimentDashboardPanel:
         for c in range(4):
             self._det_controls.grid_columnconfigure(c, weight=1)
 
-        tk.Label(self._det_controls, text="Уставка", bg="#f9f9f9", fg="#333", font=("Segoe UI", 9)).grid(row=0, column=0, sticky="w")
+        tk.Label(self._det_controls, text="Уставка", bg="#f9f9f9", fg="#333", font=self._F_sub).grid(row=0, column=0, sticky="w")
         self._det_set_var = tk.StringVar(value="")
         self._det_set_entry = ttk.Entry(self._det_controls, textvariable=self._det_set_var, width=10)
         self._det_set_entry.grid(row=1, column=0, sticky="w", pady=(2, 0))
 
-        tk.Label(self._det_controls, text="Нижний предел", bg="#f9f9f9", fg="#333", font=("Segoe UI", 9)).grid(row=0, column=1, sticky="w")
+        tk.Label(self._det_controls, text="Нижний предел", bg="#f9f9f9", fg="#333", font=self._F_sub).grid(row=0, column=1, sticky="w")
         self._det_lo_var = tk.StringVar(value="")
         self._det_lo_entry = ttk.Entry(self._det_controls, textvariable=self._det_lo_var, width=10)
         self._det_lo_entry.grid(row=1, column=1, sticky="w", pady=(2, 0))
 
-        tk.Label(self._det_controls, text="Верхний предел", bg="#f9f9f9", fg="#333", font=("Segoe UI", 9)).grid(row=0, column=2, sticky="w")
+        tk.Label(self._det_controls, text="Верхний предел", bg="#f9f9f9", fg="#333", font=self._F_sub).grid(row=0, column=2, sticky="w")
         self._det_hi_var = tk.StringVar(value="")
         self._det_hi_entry = ttk.Entry(self._det_controls, textvariable=self._det_hi_var, width=10)
         self._det_hi_entry.grid(row=1, column=2, sticky="w", pady=(2, 0))
@@ -1893,9 +2186,10 @@ class ExperimentDashboardPanel:
         self._det_graph_frame = tk.Frame(body, bg="#f9f9f9")
         self._det_graph_frame.grid(row=1, column=0, sticky="nsew", pady=(10, 0))
         self._det_graph_frame.grid_columnconfigure(0, weight=1)
-        tk.Label(self._det_graph_frame, text="График", bg="#f9f9f9", fg="#333", font=("Segoe UI", 9)).grid(row=0, column=0, sticky="w")
+        tk.Label(self._det_graph_frame, text="График", bg="#f9f9f9", fg="#333", font=self._F_sub).grid(row=0, column=0, sticky="w")
         self._det_graph_canvas = tk.Canvas(self._det_graph_frame, height=110, bg="#ffffff", highlightthickness=1, highlightbackground="#e3e3e3")
         self._det_graph_canvas.grid(row=1, column=0, sticky="ew", pady=(4, 0))
+        self._det_graph_canvas.bind("<Configure>", self._on_det_graph_configure)
 
         # по умолчанию — режим управления
         self._det_graph_frame.grid_remove()
@@ -1913,8 +2207,9 @@ class ExperimentDashboardPanel:
 
         self._selected_tile_key = key
         self._apply_tile_selected_style(key, selected=True)
+        self._ensure_details_panel()
 
-        spec: TileSpec = self._tile_widgets[key]["spec"]
+        spec: TileSpec = self._tile_widgets[key].spec
         self._details_title.configure(text=f"Параметр: {spec.title}")
 
         if spec.kind == "monitor":
@@ -1955,7 +2250,7 @@ class ExperimentDashboardPanel:
 
         # заполнение полей (однократно при выборе)
         if spec.kind == "control":
-            sp = self._get_setpoint_value(spec)
+            sp = self._get_setpoint_value(spec, *self._snapshot())
             self._det_set_var.set("" if sp is None else str(sp))
             lim = self._limits.get(spec.key, {}) or {}
             lo = lim.get("lo", "")
@@ -1969,59 +2264,67 @@ class ExperimentDashboardPanel:
         self._emit_state()
 
     def _refresh_selected_detail(self, force: bool = False):
-        if not self._selected_tile_key or self._selected_tile_key not in self._tile_widgets:
+        if not self._details_built or not self._selected_tile_key or self._selected_tile_key not in self._tile_widgets:
             return
-        spec: TileSpec = self._tile_widgets[self._selected_tile_key]["spec"]
-        actual = self._get_current_value(spec)
+        spec: TileSpec = self._tile_widgets[self._selected_tile_key].spec
+        actual = self._get_current_value(spec, *self._snapshot())
         try:
-            self._det_actual.configure(text=self._format_value(actual, spec))
+            self._set_label_text(self._det_actual, self._format_value(actual, spec))
         except Exception:
             pass
 
         if spec.kind == "monitor":
-            try:
-                hist = list(self._tile_history.get(spec.key, []) or [])
+            hist = self._tile_history.get(spec.key)
+            if hist is not None:
                 self._draw_detail_graph(hist)
-            except Exception:
-                pass
 
-    def _draw_detail_graph(self, values: List[float]):
+    def _draw_detail_graph(self, values: Deque[float]):
+        """График панели деталей: элементы создаются один раз, далее меняются координаты и текст."""
         c = getattr(self, '_det_graph_canvas', None)
         if c is None:
             return
-        try:
-            c.delete('all')
-        except Exception:
-            return
-        if not values or len(values) < 2:
+        w, h = self._det_graph_size
+        # история ограничена _TILE_HISTORY_LEN (60) — это и есть окно графика
+        window = tuple(values)
+        sig = (window, w, h)
+        if sig == self._det_graph_sig:
             return
+        ids = self._det_graph_items
         try:
-            w = int(c.winfo_width() or 1)
-            h = int(c.winfo_height() or 1)
-        except Exception:
-            w, h = 400, 110
-        pad = 10
-        xs = values[-60:]
-        vmin = min(xs)
-        vmax = max(xs)
-        if abs(vmax - vmin) < 1e-9:
-            vmax = vmin + 1.0
-        n = len(xs)
-        dx = (w - 2 * pad) / max(1, (n - 1))
-        pts = []
-        for i, v in enumerate(xs):
-            x = pad + i * dx
-            y = h - pad - ((v - vmin) / (vmax - vmin)) * (h - 2 * pad)
-            pts.extend([x, y])
-        try:
-            c.create_line(pts, width=2, smooth=True)
-        except Exception:
-            pass
-        try:
-            c.create_text(pad, pad, text=f"{vmax:.2f}", anchor='nw', fill='#666', font=('Segoe UI', 8))
-            c.create_text(pad, h - pad, text=f"{vmin:.2f}", anchor='sw', fill='#666', font=('Segoe UI', 8))
+            if len(window) < 2:
+                if ids is not None:
+                    for item in ids:
+                        c.itemconfigure(item, state='hidden')
+                self._det_graph_sig = sig
+                return
+            pad = 10
+            vals = np.asarray(_stride_window(window, w // 3), dtype=np.float64)
+            vmin, vmax = _min_max(vals)
+            n = len(vals)
+            dx = (w - 2 * pad) / max(1, (n - 1))
+            xs = pad + np.arange(n) * dx
+            ys = (h - pad) - (vals - vmin) * ((h - 2 * pad) / (vmax - vmin))
+            pts = np.column_stack((xs, ys)).ravel().tolist()
+            if ids is None:
+                line = c.create_line(pts, width=2, smooth=True)
+                t_max = c.create_text(pad, pad, text=f"{vmax:.2f}", anchor='nw', fill='#666', font=self._F_small)
+                t_min = c.create_text(pad, h - pad, text=f"{vmin:.2f}", anchor='sw', fill='#666', font=self._F_small)
+                self._det_graph_items = (line, t_max, t_min)
+            else:
+                line, t_max, t_min = ids
+                c.coords(line, pts)
+                c.itemconfigure(t_max, text=f"{vmax:.2f}", state='normal')
+                c.coords(t_min, pad, h - pad)
+                c.itemconfigure(t_min, text=f"{vmin:.2f}", state='normal')
+                c.itemconfigure(line, state='normal')
         except Exception:
-            pass
+            return
+        self._det_graph_sig = sig
+
+    def _on_det_graph_configure(self, e):
+        self._det_graph_size = (max(1, int(e.width)), max(1, int(e.height)))
+        if self._selected_tile_key:
+            self._refresh_selected_detail()
 
     def _apply_tile_selected_style(self, key: str, selected: bool):
         w = self._tile_widgets.get(key)
@@ -2029,43 +2332,23 @@ class ExperimentDashboardPanel:
             return
         
         # Проверяем, включена ли автоматизация
-        is_auto = False
-        if key == "ph" and getattr(self.app, 'ph_auto_co2_var', tk.BooleanVar(value=False)).get():
-            is_auto = True
-        elif key == "do" and getattr(self.app, 'do_auto_aeration_var', tk.BooleanVar(value=False)).get():
-            is_auto = True
-        
+        is_auto = self._tile_is_auto(key)
+
         if is_auto:
-            fill = w.get('auto_sel_bg') if selected else w.get('auto_bg')
-            outline = w.get('auto_br') if selected else w.get('auto_br')
+            fill = w.auto_sel_bg if selected else w.auto_bg
+            outline = w.auto_br
         else:
-            fill = w.get('fill_sel') if selected else w.get('fill_base')
-            outline = w.get('border_sel') if selected else w.get('border_base')
-        
-        try:
-            c = w.get('frame')
-            poly = w.get('poly')
-            if c is not None and poly is not None:
-                c.itemconfigure(poly, fill=fill, outline=outline)
-        except Exception:
-            pass
-        
-        # обновление фонов вложенных виджетов
-        try:
-            for ww in w.get('child_bgs', []) or []:
-                try:
-                    ww.configure(bg=fill)
-                except Exception:
-                    pass
-        except Exception:
-            pass
+            fill = w.fill_sel if selected else w.fill_base
+            outline = w.border_sel if selected else w.border_base
+
+        self._paint_tile(w, fill, outline)
 
     # ---------------------- details apply ----------------------
 
     def _apply_detail(self):
         if not self._selected_tile_key or self._selected_tile_key not in self._tile_widgets:
             return
-        spec: TileSpec = self._tile_widgets[self._selected_tile_key]['spec']
+        spec: TileSpec = self._tile_widgets[self._selected_tile_key].spec
 
         # Для мониторинговых и action-плиток уставки/лимиты не применяются
         if spec.kind != 'control':
@@ -2083,7 +2366,6 @@ class ExperimentDashboardPanel:
             self._limits[spec.key] = lim
         else:
             self._limits.pop(spec.key, None)
-        self.state['limits'] = dict(self._limits)
 
         # setpoint apply
         raw = self._det_set_var.get().strip().replace(',', '.')
@@ -2098,22 +2380,16 @@ class ExperimentDashboardPanel:
         if not self._selected_tile_key:
             return
         self._limits.pop(self._selected_tile_key, None)
-        self.state['limits'] = dict(self._limits)
-        self._det_lo_var.set('')
-        self._det_hi_var.set('')
+        if self._details_built:
+            self._det_lo_var.set('')
+            self._det_hi_var.set('')
         self._emit_state()
 
     def _apply_setpoint(self, spec: TileSpec, value: float):
         running = bool(getattr(self.app, "_experiment_running", False))
         # во время эксперимента — runtime
-        if running:
-            try:
-                fn = getattr(self.app, "apply_runtime_parameter", None)
-                if callable(fn) and spec.setpoint_key:
-                    fn(spec.setpoint_key, value)
-                    return
-            except Exception:
-                pass
+        if running and spec.setpoint_key and self._call_app("apply_runtime_parameter", spec.setpoint_key, value):
+            return
 
         # до старта — обновляем переменную (для apply_settings)
         if spec.var_name:
@@ -2128,12 +2404,7 @@ class ExperimentDashboardPanel:
                 pass
 
         # сразу фиксируем в applied (чтобы валидация и UI синхронизировались)
-        try:
-            fn2 = getattr(self.app, "apply_settings", None)
-            if callable(fn2):
-                fn2()
-        except Exception:
-            pass
+        self._call_app("apply_settings")
 
     # ---------------------- refresh loop ----------------------
 
@@ -2141,29 +2412,69 @@ class ExperimentDashboardPanel:
         self._refresh()
 
     def _refresh(self):
+        t0 = time.perf_counter()
+        running = bool(getattr(self.app, "_experiment_running", False))
+        # регуляторы имеют смысл только во время эксперимента (runtime-параметры вне его не применяются)
+        if running:
+            # каждый тик регулятора целиком под одним try: сбой одного не мешает другому
+            for tick in (self._ph_auto_controller_tick, self._do_auto_controller_tick):
+                try:
+                    tick()
+                except Exception:
+                    pass
+
+        # скрытую панель не перерисовываем (регуляторы и история работают всегда)
         try:
-            self._ph_auto_controller_tick()
-            self._do_auto_controller_tick()
-            self._update_gas_tiles()
-        except Exception:
-            pass
-        
-        self._refresh_header()
-        self._refresh_tiles()
-        try:
-            self._update_glucose_tile()
-            self._update_biomass_add_tile()
+            visible = bool(self._frame.winfo_viewable())
         except Exception:
-            pass
+            visible = False
+        if visible:
+            try:
+                self._update_gas_tiles()
+            except Exception:
+                pass
+            self._refresh_header()
+            self._refresh_tiles()
+            try:
+                self._update_glucose_tile()
+                self._update_biomass_add_tile()
+            except Exception:
+                pass
+            try:
+                self._refresh_selected_detail()
+            except Exception:
+                pass
+            self._draw_reactor()
+        self._update_history()
+
+        # часто тикаем только во время эксперимента, когда панель видна или работает автоматика
+        if running and (visible or self._controllers_active()):
+            interval = self.REFRESH_MS
+        else:
+            interval = self.REFRESH_IDLE_MS
+        if time.perf_counter() - t0 > self.REFRESH_SLOW_S:
+            interval = min(self.REFRESH_MAX_MS, interval * 2)
         try:
-            self._refresh_selected_detail()
+            self._refresh_job = self.parent.after(interval, self._queue_refresh)
         except Exception:
-            pass
-        self._draw_reactor()
-        self._update_history()
-        
+            self._refresh_job = None
+
+    def _controllers_active(self) -> bool:
+        """Включён ли хотя бы один регулятор (pH через CO2 или DO через аэрацию)."""
+        refs = self._get_ctrl_refs()
+        for key in ("ph_auto", "do_auto"):
+            v = refs[key]
+            try:
+                if v is not None and v.get():
+                    return True
+            except tk.TclError:
+                pass
+        return False
+
+    def _queue_refresh(self):
+        """Таймер истёк: обновляемся, когда цикл событий освободится от ввода."""
         try:
-            self._refresh_job = self.parent.after(500, self._refresh)
+            self._refresh_job = self.parent.after_idle(self._refresh)
         except Exception:
             self._refresh_job = None
 
@@ -2176,8 +2487,6 @@ class ExperimentDashboardPanel:
             glucose = float(rt.get('glucose', 0.0))
             now = time.time()
             self._glucose_history.append((now, glucose))
-            if len(self._glucose_history) > 100:
-                self._glucose_history.pop(0)
         except Exception:
             pass
         
@@ -2186,8 +2495,6 @@ class ExperimentDashboardPanel:
             biomass = float(rt.get('biomass', 0.0))
             now = time.time()
             self._biomass_history.append((now, biomass))
-            if len(self._biomass_history) > 100:
-                self._biomass_history.pop(0)
         except Exception:
             pass
 
@@ -2198,15 +2505,15 @@ class ExperimentDashboardPanel:
             txt = "Не запущено"
         else:
             txt = "Пауза" if paused else "Выполняется"
-        try:
-            exp = str(getattr(self.app, "exp_name_var").get() or "")
-        except Exception:
-            exp = ""
+        exp = str(self._var_exp_name.get() or "")
         if exp:
             txt = f"{txt} • {exp}"
-        self._hdr_status.configure(text=txt)
+        self._set_label_text(self._hdr_status, txt)
 
-        # состояние кнопок
+        # состояние кнопок (только при смене режима)
+        if self._hdr_btn_state == (running, paused):
+            return
+        self._hdr_btn_state = (running, paused)
         try:
             if hasattr(self, "_btn_pause"):
                 self._btn_pause.configure(text=("Продолжить" if (running and paused) else "Пауза"))
@@ -2217,38 +2524,35 @@ class ExperimentDashboardPanel:
             pass
 
     def _refresh_tiles(self):
-        for key, w in self._tile_widgets.items():
-            if key.startswith('gas_'):
-                continue  # Плитки газа обновляются отдельно
-            
-            spec: TileSpec = w.get("spec")
-            if not spec:
-                continue
+        rt, ap = self._snapshot()
+        # газовые и action-плитки в _tile_list не попадают — они обновляются отдельно
+        for w in self._tile_list:
+            spec = w.spec
+            actual = self._get_current_value(spec, rt, ap)
 
-            # action-плитки: обновляем отдельно
-            if spec.kind == "action":
-                continue
-
-            actual = self._get_current_value(spec)
-            sp = self._get_setpoint_value(spec)
-
-            try:
-                w["value"].configure(text=self._format_value(actual, spec))
-            except Exception:
-                pass
+            # sparkline: история копится каждый тик (это временной ряд)
+            self._push_history(w.hist, actual)
+            self._draw_spark(w, w.hist)
 
-            sub = ""
-            if spec.kind == "control":
-                sub = f"Уставка: {self._format_value(sp, spec)}" if sp is not None else "Уставка: —"
-            else:
-                sub = "Мониторинг"
-
-            # лимиты/статус (только для управляемых плиток)
-            status = ""
             if spec.kind == "control":
+                sp = self._get_setpoint_value(spec, rt, ap)
                 lim = self._limits.get(spec.key, {}) or {}
                 lo = lim.get("lo", None)
                 hi = lim.get("hi", None)
+                state = (actual, sp, lo, hi)
+            else:
+                state = (actual,)
+            # подписи не менялись с прошлого тика — форматирование не нужно
+            if state == w.last_state:
+                continue
+            w.last_state = state
+
+            self._set_tile_text(w, "value", self._format_value(actual, spec))
+
+            # уставка и лимиты/статус (только для управляемых плиток; у мониторинговых подпись постоянная)
+            if spec.kind == "control":
+                sub = f"Уставка: {self._format_value(sp, spec)}" if sp is not None else "Уставка: —"
+                status = ""
                 if actual is not None and (lo not in (None, "") or hi not in (None, "")):
                     try:
                         a = float(actual)
@@ -2258,129 +2562,180 @@ class ExperimentDashboardPanel:
                             status = " • выше верхнего предела"
                     except Exception:
                         pass
-            w["sub"].configure(text=sub + status)
+                self._set_tile_text(w, "sub", sub + status)
 
-            # sparkline
-            self._push_history(spec.key, actual)
-            self._draw_spark(w["spark"], self._tile_history.get(spec.key, []))
+    @staticmethod
+    def _set_tile_text(w: TileWidgets, slot: str, text: str):
+        """Меняет текст метки плитки (value / sub) только при реальном изменении (кеш в w.last_text)."""
+        if w.last_text.get(slot) == text:
+            return
+        try:
+            getattr(w, slot).configure(text=text)
+        except Exception:
+            return
+        w.last_text[slot] = text
 
-    def _push_history(self, key: str, value: Any):
+    @staticmethod
+    def _push_history(hist: Deque[float], value: Any):
         if value is None:
             return
         try:
             v = float(value)
         except Exception:
             return
-        hist = self._tile_history.setdefault(key, [])
-        hist.append(v)
-        if len(hist) > 60:
-            del hist[: len(hist) - 60]
+        # nan/inf в истории сломали бы масштаб графиков (а в int-буфере спарклайна — и координаты)
+        if math.isfinite(v):
+            hist.append(v)
 
-    def _draw_spark(self, canvas: tk.Canvas, hist: List[float]):
+    def _on_spark_configure(self, tw: TileWidgets, e):
+        tw.spark_size = (max(1, int(e.width)), max(1, int(e.height)))
+        if tw.hist is not None:
+            self._draw_spark(tw, tw.hist)
+
+    def _draw_spark(self, tw: TileWidgets, hist: Deque[float]):
+        """Спарклайн плитки: одна линия, создаётся один раз; перерисовка — только при изменении истории."""
+        canvas = tw.spark
+        w, h = tw.spark_size
         try:
-            canvas.delete("all")
-            w = max(1, int(canvas.winfo_width()))
-            h = max(1, int(canvas.winfo_height()))
             if len(hist) < 2:
                 return
-            lo = min(hist)
-            hi = max(hist)
-            if abs(hi - lo) < 1e-9:
-                hi = lo + 1.0
-            pts = []
+            window = tuple(hist)
+            sig = (window, w, h)
+            if sig == tw.spark_sig:
+                return
+            # больше точки на ~4 px не видно — прореживаем
+            hist = _stride_window(window, w // 4)
             n = len(hist)
-            for i, v in enumerate(hist):
-                x = int(i * (w - 2) / max(1, n - 1)) + 1
-                y = int((1.0 - (v - lo) / (hi - lo)) * (h - 2)) + 1
-                pts.append((x, y))
-            for i in range(1, len(pts)):
-                canvas.create_line(pts[i-1][0], pts[i-1][1], pts[i][0], pts[i][1], fill="#5b7cff", width=2)
+            dx = (w - 2) / (n - 1)
+            if n < _SPARK_NUMPY_MIN:
+                lo, hi = _widen_range(min(hist), max(hist))
+                ky = (h - 2) / (hi - lo)
+                pts = [c for i, v in enumerate(hist)
+                       for c in (int(i * dx) + 1, int((hi - v) * ky) + 1)]
+            else:
+                vals = np.fromiter(hist, dtype=np.float64, count=n)
+                lo, hi = _min_max(vals)
+                # x, y чередуются в одном целочисленном буфере (присваивание отбрасывает дробную часть)
+                buf = np.empty(2 * n, dtype=np.int64)
+                buf[0::2] = np.arange(n) * dx
+                buf[1::2] = (hi - vals) * ((h - 2) / (hi - lo))
+                buf += 1
+                pts = buf.tolist()
+            if tw.spark_line is None:
+                tw.spark_line = canvas.create_line(pts, fill=self.ACCENT, width=2)
+            else:
+                canvas.coords(tw.spark_line, pts)
+            tw.spark_sig = sig
         except Exception:
             pass
 
     def _draw_reactor(self):
         c = self._reactor
         try:
-            c.delete("all")
-            w = int(c.winfo_width())
-            h = int(c.winfo_height())
+            w, h = self._reactor_size
             if w <= 10 or h <= 10:
+                # рисовать негде — прячем элементы до следующего нормального размера
+                if self._reactor_key is not None:
+                    c.itemconfigure("reactor", state="hidden")
+                    self._reactor_key = None
                 return
 
+            rt, ap = self._snapshot()
+            sf = _safe_float
+            # уровень жидкости по объёму (условно); в настройках объёмы обычно уже float —
+            # разбор через _safe_float только для прочих типов
+            v = rt.get("volume_ml")
+            vol_ml = v if type(v) is float else sf(v, 0.0)
+            if vol_ml <= 0:
+                # fallback: из applied
+                v = ap.get("volume_ml")
+                vol_ml = v if type(v) is float else sf(v, 0.0)
+            v = ap.get("vessel_volume")
+            vessel_ml = v if type(v) is float else sf(v, 0.0)
+            if vessel_ml <= 0:
+                vessel_ml = self._vessel_ml_cache
+
+            # подписи
+            gcv, fmt = self._get_current_value, self._format_value
+            t_spec, ph_spec, do_spec = self._temp_spec, self._ph_spec, self._do_spec
+            t = fmt(gcv(t_spec, rt, ap), t_spec) if t_spec is not None else "—"
+            ph = fmt(gcv(ph_spec, rt, ap), ph_spec) if ph_spec is not None else "—"
+            do = fmt(gcv(do_spec, rt, ap), do_spec) if do_spec is not None else "—"
+
             # контур
             margin = 30
             rx0, ry0 = margin, margin
             rx1, ry1 = w - margin, h - margin
 
-            # основной корпус
-            c.create_rectangle(rx0, ry0, rx1, ry1, outline="#cfd6e6", width=2, fill="#f7f9ff")
-
-            # уровень жидкости по объёму (условно)
-            vol_ml = _safe_float(getattr(self.app, "runtime_settings", {}).get("volume_ml", 0.0), 0.0)
-            if vol_ml <= 0:
-                # fallback: из applied
-                vol_ml = _safe_float(getattr(self.app, "applied_settings", {}).get("volume_ml", 0.0), 0.0)
-            vessel_ml = _safe_float(getattr(self.app, "applied_settings", {}).get("vessel_volume", 0.0), 0.0)
-            if vessel_ml <= 0:
-                try:
-                    vessel_ml = _safe_float(getattr(self.app, "vessel_volume_var").get(), 0.0)
-                except Exception:
-                    vessel_ml = 0.0
-
             fill_ratio = 0.5
             if vessel_ml > 0 and vol_ml > 0:
-                fill_ratio = _clamp(vol_ml / vessel_ml, 0.05, 0.95)
+                r = vol_ml / vessel_ml
+                fill_ratio = 0.05 if r < 0.05 else 0.95 if r > 0.95 else r
 
             fill_h = int((ry1 - ry0) * fill_ratio)
             fy0 = ry1 - fill_h
-            c.create_rectangle(rx0 + 3, fy0, rx1 - 3, ry1 - 3, outline="", fill="#5b7cff")
-
-            # подписи
-            t = self._format_value(self._get_current_value(self._tile_widgets["temperature"]["spec"]), self._tile_widgets["temperature"]["spec"]) if "temperature" in self._tile_widgets else "—"
-            ph = self._format_value(self._get_current_value(self._tile_widgets["ph"]["spec"]), self._tile_widgets["ph"]["spec"]) if "ph" in self._tile_widgets else "—"
-            do = self._format_value(self._get_current_value(self._tile_widgets["do"]["spec"]), self._tile_widgets["do"]["spec"]) if "do" in self._tile_widgets else "—"
 
-            c.create_text(w // 2, ry0 - 10, text="Биореактор", fill="#223", font=("Segoe UI", 11, "bold"))
-            c.create_text(w // 2, ry0 + 12, text=f"T={t} °C   pH={ph}   DO={do} %", fill="#223", font=("Segoe UI", 10))
+            # рисунок не изменился (уровень в пикселях и подписи те же) — ни одной команды холсту
+            key = (w, h, fy0, t, ph, do)
+            if key == self._reactor_key:
+                return
+            stats = f"T={t} °C   pH={ph}   DO={do} %"
+
+            outline, liquid, title, text = self._reactor_items
+            last = self._reactor_key
+            resized = last is None or last[:2] != (w, h)
+            if resized:
+                # корпус и заголовок зависят только от размера холста
+                c.coords(outline, rx0, ry0, rx1, ry1)
+                c.coords(title, w // 2, ry0 - 10)
+                c.coords(text, w // 2, ry0 + 12)
+            # каждому элементу — только его изменения: уровень жидкости и показания меняются независимо
+            if resized or last[2] != fy0:
+                c.coords(liquid, rx0 + 3, fy0, rx1 - 3, ry1 - 3)
+            if last is None or last[3:] != key[3:]:
+                c.itemconfigure(text, text=stats)
+            if last is None:
+                c.itemconfigure("reactor", state="normal")
+            self._reactor_key = key
 
         except Exception:
             pass
 
     # ---------------------- value getters ----------------------
 
-    def _get_current_value(self, spec: TileSpec) -> Optional[float]:
-        rt = getattr(self.app, "runtime_settings", {}) or {}
+    def _snapshot(self) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """(runtime_settings, applied_settings) приложения — читаются один раз на проход обновления."""
+        app = self.app
+        return (getattr(app, "runtime_settings", None) or {},
+                getattr(app, "applied_settings", None) or {})
+
+    def _get_current_value(self, spec: TileSpec, rt: Dict[str, Any], ap: Dict[str, Any]) -> Optional[float]:
         v = rt.get(spec.current_key, None)
         if v is None:
             # иногда до старта/до apply — берем из applied
-            ap = getattr(self.app, "applied_settings", {}) or {}
             v = ap.get(spec.current_key, None)
-        try:
-            if v is None:
-                return None
-            return float(v)
-        except Exception:
+        if v is None:
             return None
+        # _safe_float: числа — без обработчика исключений, прочее — с узким except
+        return _safe_float(v, None)
 
-    def _get_setpoint_value(self, spec: TileSpec) -> Optional[float]:
+    def _get_setpoint_value(self, spec: TileSpec, rt: Dict[str, Any], ap: Dict[str, Any]) -> Optional[float]:
         if spec.kind != "control":
             return None
         running = bool(getattr(self.app, "_experiment_running", False))
         if running and spec.setpoint_key:
-            rt = getattr(self.app, "runtime_settings", {}) or {}
             if spec.setpoint_key in rt:
                 return _safe_float(rt.get(spec.setpoint_key), None)
 
         # до старта: var_name -> app var
         if spec.var_name:
-            try:
-                var = getattr(self.app, spec.var_name, None)
-                if var is not None and hasattr(var, "get"):
+            var = getattr(self.app, spec.var_name, None)
+            if var is not None and hasattr(var, "get"):
+                try:
                     return _safe_float(var.get(), None)
-            except Exception:
-                pass
+                except tk.TclError:
+                    pass  # в поле ввода недописанное значение
 
-        ap = getattr(self.app, "applied_settings", {}) or {}
         if spec.setpoint_key and spec.setpoint_key in ap:
             return _safe_float(ap.get(spec.setpoint_key), None)
         return None
@@ -2388,22 +2743,31 @@ class ExperimentDashboardPanel:
     def _format_value(self, v: Any, spec: TileSpec) -> str:
         if v is None:
             return "—"
-        try:
-            return spec.fmt.format(float(v))
-        except Exception:
-            try:
-                return str(v)
-            except Exception:
-                return "—"
+        f = v if type(v) is float else _safe_float(v, None)
+        if f is None:
+            return str(v)
+        return spec.fmt_fn(f)
 
     # ---------------------- state persistence ----------------------
 
     def _emit_state(self):
+        """Помечает состояние изменённым; уведомление отправляется один раз при простое."""
+        self._state_dirty = True
+        if self._state_job is None:
+            self._state_job = self.parent.after_idle(self._flush_state)
+
+    def _flush_state(self):
+        self._state_job = None
+        if not self._state_dirty:
+            return
+        self._state_dirty = False
         self.state["selected_tile_key"] = self._selected_tile_key
+        # единственная копия пределов: state уходит наружу, а _limits панель продолжает менять
         self.state["limits"] = dict(self._limits)
         self.state["db_path"] = self._db_path or ""
         try:
             if callable(self.on_state_changed):
-                self.on_state_changed(dict(self.state))
+                # получатель (WorkspaceApp) сам копирует state — передаём без копии, только для чтения
+                self.on_state_changed(self.state)
         except Exception:
             pass
\ No newline at end of file